@@ -4,7 +4,6 @@ Unified Bash hook that combines all bash command safety checks.
 Supports three decision types: allow, ask (user prompt), block (deny).
 """
 
-import json
 import os
 import sys
 
@@ -20,13 +19,7 @@ else:
     # Fallback for running outside plugin context
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import check functions from other hooks
-from env_file_protection_hook import check_env_file_access
-from git_add_block_hook import check_git_add_command
-from git_checkout_safety_hook import check_git_checkout_command
-from git_commit_block_hook import check_git_commit_command
-from git_push_pull_ask_hook import check_git_push_pull_command
-from rm_block_hook import check_rm_command
+from hook_io import forward_to_daemon, load_hook_input, write_hook_output
 
 
 def normalize_check_result(result):
@@ -42,18 +35,27 @@ def normalize_check_result(result):
     return (decision, reason)
 
 
-def main():
-    data = json.load(sys.stdin)
-
+def decide(data):
+    """
+    Run all checks on a hook payload and return the hook output to emit.
+    """
     # Check if this is a Bash tool call
     tool_name = data.get("tool_name")
     if tool_name != "Bash":
-        print(json.dumps({"decision": "approve"}))
-        sys.exit(0)
+        return {"decision": "approve"}
 
     # Get the command being executed
     command = data.get("tool_input", {}).get("command", "")
 
+    # Import check functions from other hooks here rather than at module level,
+    # so a payload forwarded to the hook daemon never loads them
+    from env_file_protection_hook import check_env_file_access
+    from git_add_block_hook import check_git_add_command
+    from git_checkout_safety_hook import check_git_checkout_command
+    from git_commit_block_hook import check_git_commit_command
+    from git_push_pull_ask_hook import check_git_push_pull_command
+    from rm_block_hook import check_rm_command
+
     # Run all checks
     checks = [
         check_rm_command,
@@ -82,35 +84,37 @@ def main():
             combined_reason = "Multiple safety checks failed:\n\n"
             for i, reason in enumerate(block_reasons, 1):
                 combined_reason += f"{i}. {reason}\n\n"
-        print(
-            json.dumps(
-                {
-                    "hookSpecificOutput": {
-                        "hookEventName": "PreToolUse",
-                        "permissionDecision": "deny",
-                        "permissionDecisionReason": combined_reason,
-                    }
-                },
-                ensure_ascii=False,
-            )
-        )
-    elif ask_reasons:
+        return {
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": "deny",
+                "permissionDecisionReason": combined_reason,
+            }
+        }
+
+    if ask_reasons:
         combined_reason = (
             ask_reasons[0] if len(ask_reasons) == 1 else "Approval required: " + "; ".join(ask_reasons)
         )
-        print(
-            json.dumps(
-                {
-                    "hookSpecificOutput": {
-                        "hookEventName": "PreToolUse",
-                        "permissionDecision": "ask",
-                        "permissionDecisionReason": combined_reason,
-                    }
-                }
-            )
-        )
-    else:
-        print(json.dumps({"decision": "approve"}))
+        return {
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": "ask",
+                "permissionDecisionReason": combined_reason,
+            }
+        }
+
+    return {"decision": "approve"}
+
+
+def main():
+    data = load_hook_input()
+
+    # Use the hook daemon when one is running, otherwise check locally
+    output = forward_to_daemon("bash", data)
+    if output is None:
+        output = decide(data)
+    write_hook_output(output)
 
     sys.exit(0)
 
@@ -1,6 +1,42 @@
 """Shared utilities for bash command parsing."""
 
 import re
+from collections.abc import Iterator
+
+# Compound command operators: &&, || and ;
+_SEPARATOR_RE = re.compile(r"\s*(?:&&|\|\||;)\s*")
+
+
+def iter_subcommands(command: str) -> Iterator[str]:
+    """
+    Lazily yield the subcommands of a compound bash command.
+    Splits on &&, ||, and ; operators.
+
+    Each subcommand is split off only when the caller asks for it, so a hook
+    that returns on the first dangerous subcommand never scans the rest of
+    the command. Callers should iterate it directly rather than build a list.
+
+    Args:
+        command: A bash command string, possibly compound.
+
+    Yields:
+        Individual subcommands, stripped, skipping empty ones.
+
+    Example:
+        >>> next(iter_subcommands("cd /tmp && git add . && git commit -m 'msg'"))
+        'cd /tmp'
+    """
+    if not command:
+        return
+    start = 0
+    for match in _SEPARATOR_RE.finditer(command):
+        subcommand = command[start : match.start()].strip()
+        if subcommand:
+            yield subcommand
+        start = match.end()
+    subcommand = command[start:].strip()
+    if subcommand:
+        yield subcommand
 
 
 def extract_subcommands(command: str) -> list[str]:
@@ -18,7 +54,4 @@ def extract_subcommands(command: str) -> list[str]:
         >>> extract_subcommands("cd /tmp && git add . && git commit -m 'msg'")
         ['cd /tmp', 'git add .', "git commit -m 'msg'"]
     """
-    if not command:
-        return []
-    subcommands = re.split(r"\s*(?:&&|\|\||;)\s*", command)
-    return [cmd.strip() for cmd in subcommands if cmd.strip()]
+    return list(iter_subcommands(command))
@@ -6,14 +6,31 @@ Users can customize hook behavior by creating config files at:
 
 Configs are merged: defaults → global → project (project overrides global).
 If no config file exists, default values are used.
+
+The parsed YAML of both config files is cached on disk as JSON
+(~/.claude/plugins/.config.cache.json), keyed on their path, mtime and size, so
+hook processes can skip YAML parsing while neither file has changed. The cache
+holds the raw YAML data rather than the merged config, so it stays valid when
+SafetyHooksConfig itself changes.
+
+A wrapper that launches hooks can also set SAFETY_HOOKS_CONFIG_JSON to a JSON
+object of config fields; hooks then use it instead of reading config files.
 """
 
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Any
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 
+# Only type checkers need typing; skipping the import keeps hook startup fast
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
 
-@dataclass
+
+@dataclass(slots=True)
 class SafetyHooksConfig:
     """Configuration for safety hooks behavior."""
 
@@ -47,112 +64,123 @@ class SafetyHooksConfig:
     # Env protection settings
     env_protection_ignore_patterns: list[str] | None = None  # Patterns for .env files to ignore
 
+    # Resolved file_extensions (None = use default list), kept in sync by _apply_config_data
+    _extensions_set: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._extensions_set = _resolve_extensions(self.file_extensions)
+
 
 # Default source code extensions (when not specified in config)
-DEFAULT_SOURCE_CODE_EXTENSIONS: set[str] = {
-    # Python
-    ".py",
-    ".pyi",
-    ".pyx",
-    # JavaScript/TypeScript
-    ".js",
-    ".jsx",
-    ".ts",
-    ".tsx",
-    ".mjs",
-    ".cjs",
-    ".d.ts",
-    # Web
-    ".vue",
-    ".svelte",
-    ".astro",
-    # Systems languages
-    ".c",
-    ".cpp",
-    ".cc",
-    ".cxx",
-    ".h",
-    ".hpp",
-    ".hxx",
-    ".rs",
-    ".go",
-    # JVM languages
-    ".java",
-    ".kt",
-    ".kts",
-    ".scala",
-    ".groovy",
-    ".cljs",
-    ".cljc",
-    # Microsoft
-    ".cs",
-    ".vb",
-    ".fs",
-    ".fsi",
-    # Scripting
-    ".rb",
-    ".php",
-    ".swift",
-    ".dart",
-    ".lua",
-    ".pl",
-    ".pm",
-    ".sh",
-    ".bash",
-    ".zsh",
-    ".fish",
-    ".ps1",
-    ".psm1",
-    # Data/Stats
-    ".r",
-    ".rmd",
-    ".jl",
-    # Functional
-    ".hs",
-    ".ml",
-    ".mli",
-    ".re",
-    ".rei",
-    ".ex",
-    ".exs",
-    ".erl",
-    ".hrl",
-    # Config/Data formats
-    ".yaml",
-    ".yml",
-    ".toml",
-    ".xml",
-    ".sql",
-    ".graphql",
-    ".gql",
-    ".proto",
-    # Other
-    ".scm",
-    ".ss",
-    ".lisp",
-    ".lsp",
-    ".cl",
-    ".fsx",
-    ".v",
-    ".sv",
-    ".svh",
-    ".nim",
-    ".zig",
-    ".ada",
-    ".adb",
-    ".ads",
-}
-
-
-def get_config_paths() -> tuple[Path, Path]:
+DEFAULT_SOURCE_CODE_EXTENSIONS: frozenset[str] = frozenset(
+    {
+        # Python
+        ".py",
+        ".pyi",
+        ".pyx",
+        # JavaScript/TypeScript
+        ".js",
+        ".jsx",
+        ".ts",
+        ".tsx",
+        ".mjs",
+        ".cjs",
+        ".d.ts",
+        # Web
+        ".vue",
+        ".svelte",
+        ".astro",
+        # Systems languages
+        ".c",
+        ".cpp",
+        ".cc",
+        ".cxx",
+        ".h",
+        ".hpp",
+        ".hxx",
+        ".rs",
+        ".go",
+        # JVM languages
+        ".java",
+        ".kt",
+        ".kts",
+        ".scala",
+        ".groovy",
+        ".cljs",
+        ".cljc",
+        # Microsoft
+        ".cs",
+        ".vb",
+        ".fs",
+        ".fsi",
+        # Scripting
+        ".rb",
+        ".php",
+        ".swift",
+        ".dart",
+        ".lua",
+        ".pl",
+        ".pm",
+        ".sh",
+        ".bash",
+        ".zsh",
+        ".fish",
+        ".ps1",
+        ".psm1",
+        # Data/Stats
+        ".r",
+        ".rmd",
+        ".jl",
+        # Functional
+        ".hs",
+        ".ml",
+        ".mli",
+        ".re",
+        ".rei",
+        ".ex",
+        ".exs",
+        ".erl",
+        ".hrl",
+        # Config/Data formats
+        ".yaml",
+        ".yml",
+        ".toml",
+        ".xml",
+        ".sql",
+        ".graphql",
+        ".gql",
+        ".proto",
+        # Other
+        ".scm",
+        ".ss",
+        ".lisp",
+        ".lsp",
+        ".cl",
+        ".fsx",
+        ".v",
+        ".sv",
+        ".svh",
+        ".nim",
+        ".zig",
+        ".ada",
+        ".adb",
+        ".ads",
+    }
+)
+
+
+# Config file location relative to the home or project directory
+_CONFIG_RELATIVE_PATH = os.path.join(".claude", "plugins", "safety-hooks-config.yaml")
+
+
+def get_config_paths() -> tuple[str, str]:
     """Get paths to global and project config files.
 
     Returns:
         (global_config_path, project_config_path)
     """
-    home = Path.home()
-    global_config = home / ".claude" / "plugins" / "safety-hooks-config.yaml"
-    project_config = Path.cwd() / ".claude" / "plugins" / "safety-hooks-config.yaml"
+    global_config = os.path.join(os.path.expanduser("~"), _CONFIG_RELATIVE_PATH)
+    project_config = os.path.join(os.getcwd(), _CONFIG_RELATIVE_PATH)
     return global_config, project_config
 
 
@@ -177,6 +205,7 @@ def _apply_config_data(config: SafetyHooksConfig, data: dict[str, Any]) -> None:
         fll = data["file_length_limit"]
         config.file_max_lines = fll.get("max_lines", config.file_max_lines)
         config.file_extensions = fll.get("extensions", config.file_extensions)
+        config._extensions_set = _resolve_extensions(config.file_extensions)
 
     if "rm_block" in data:
         rm = data["rm_block"]
@@ -204,27 +233,110 @@ def _apply_config_data(config: SafetyHooksConfig, data: dict[str, Any]) -> None:
         )
 
 
+# Bump when the on-disk cache layout changes so stale caches are ignored
+_CONFIG_CACHE_VERSION = 4
+
+
+def get_config_cache_path() -> str:
+    """Get path to the on-disk cache of the parsed config files."""
+    return os.path.join(os.path.expanduser("~"), ".claude", "plugins", ".config.cache.json")
+
+
+def _file_fingerprint(path: str) -> tuple[str, int, int] | None:
+    """Return (path, mtime_ns, size) for a file, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return path, st.st_mtime_ns, st.st_size
+
+
+def _read_cached_config_data(cache_path: str, key: str) -> list[Any] | None:
+    """Return the cached YAML data if it was parsed from the same config files."""
+    try:
+        with open(cache_path, "rb") as f:
+            cached = json.loads(f.read())
+        if cached["key"] == key:
+            return cached["data"]
+    except Exception:
+        pass
+    return None
+
+
+def _write_cached_config_data(cache_path: str, key: str, config_data: list[Any]) -> None:
+    """Atomically write the parsed YAML data to the on-disk cache."""
+    try:
+        payload = json.dumps({"key": key, "data": config_data})
+    except (TypeError, ValueError):
+        return  # YAML types JSON cannot hold (e.g. dates)
+    # Skip data that would not read back identically (e.g. non-string keys)
+    if json.loads(payload)["data"] != config_data:
+        return
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Cache is best-effort (e.g. ~/.claude/plugins does not exist)
+        pass
+
+
+@lru_cache(maxsize=4)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML config file, memoized per process on its fingerprint.
+
+    The returned data is shared between calls and must not be mutated.
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+
+    with open(path, "rb") as f:
+        return yaml.load(f.read(), Loader=YamlLoader)
+
+
 def load_config() -> SafetyHooksConfig:
     """Load configuration from files and merge them.
 
     Merge order: defaults → global config → project config
     Project settings override global settings.
     """
-    config = SafetyHooksConfig()
     global_config, project_config = get_config_paths()
+    global_fingerprint = _file_fingerprint(global_config)
+    project_fingerprint = _file_fingerprint(project_config)
+
+    # Default install: no config files, so skip the cache and the YAML import entirely
+    if global_fingerprint is None and project_fingerprint is None:
+        return SafetyHooksConfig()
+
+    cache_path = get_config_cache_path()
+    cache_key = json.dumps([_CONFIG_CACHE_VERSION, global_fingerprint, project_fingerprint])
+    config_data = _read_cached_config_data(cache_path, cache_key)
+    if config_data is None:
+        config_data = []
+        for fingerprint in (global_fingerprint, project_fingerprint):
+            if fingerprint is None:
+                continue
+            try:
+                config_data.append(_parse_yaml(*fingerprint))
+            except FileNotFoundError:
+                continue
+            except Exception:
+                # Invalid config: keep the files parsed so far, like a partial merge
+                break
+        _write_cached_config_data(cache_path, cache_key, config_data)
 
-    try:
-        import yaml
-
-        # Load and merge global config first
-        if global_config.exists():
-            global_data = yaml.safe_load(global_config.read_text())
-            _apply_config_data(config, global_data or {})
+    config = SafetyHooksConfig()
 
-        # Then load and merge project config (overrides global)
-        if project_config.exists():
-            project_data = yaml.safe_load(project_config.read_text())
-            _apply_config_data(config, project_data or {})
+    try:
+        # Merge global config first, then project config (overrides global)
+        for data in config_data:
+            _apply_config_data(config, data or {})
 
     except Exception:
         # If config is invalid, use current config (with defaults or partial merges)
@@ -233,16 +345,33 @@ def load_config() -> SafetyHooksConfig:
     return config
 
 
-def get_source_code_extensions() -> set[str]:
+def _resolve_extensions(extensions: list[str] | None) -> frozenset[str] | None:
+    """Resolve configured extensions to a set, or None to use the default list."""
+    if not extensions or "auto" in extensions:
+        return None
+    return frozenset(extensions)
+
+
+def get_source_code_extensions() -> frozenset[str]:
     """Get the configured source code extensions."""
-    config = load_config()
+    return get_config()._extensions_set or DEFAULT_SOURCE_CODE_EXTENSIONS
+
+
+# Environment variable holding a pre-resolved config as a JSON object
+CONFIG_ENV_VAR = "SAFETY_HOOKS_CONFIG_JSON"
 
-    if config.file_extensions:
-        if "auto" in config.file_extensions or not config.file_extensions:
-            return DEFAULT_SOURCE_CODE_EXTENSIONS
-        return set(config.file_extensions)
 
-    return DEFAULT_SOURCE_CODE_EXTENSIONS
+def _config_from_env() -> SafetyHooksConfig | None:
+    """Build the config from CONFIG_ENV_VAR, or None if it is unset or invalid."""
+    blob = os.environ.get(CONFIG_ENV_VAR)
+    if not blob:
+        return None
+    try:
+        data = json.loads(blob)
+        init_fields = {f.name for f in fields(SafetyHooksConfig) if f.init}
+        return SafetyHooksConfig(**{k: v for k, v in data.items() if k in init_fields})
+    except Exception:
+        return None
 
 
 # Cached config for performance
@@ -253,7 +382,7 @@ def get_config() -> SafetyHooksConfig:
     """Get cached configuration or load it."""
     global _cached_config
     if _cached_config is None:
-        _cached_config = load_config()
+        _cached_config = _config_from_env() or load_config()
     return _cached_config
 
 
@@ -8,55 +8,112 @@ Configuration via .claude/plugins/safety-hooks-config.yaml:
 - env_protection.ignore_patterns: List of regex patterns for .env files to ignore
 """
 
-import json
+from __future__ import annotations
+
 import re
 import sys
+from functools import lru_cache
+
+from hook_io import load_hook_input, write_hook_output
 
 # Import config module for runtime configuration
 try:
     from config import get_config  # type: ignore[no-redef]
 except ImportError:
     # Fallback if config module not available
+    @lru_cache(maxsize=1)
     def get_config():  # type: ignore[no-redef]
         class DefaultConfig:
+            __slots__ = ()
+
             env_protection_enabled = True
             env_protection_ignore_patterns = None
 
         return DefaultConfig()
 
 
-def _extract_env_path(command: str) -> str | None:
-    """Extract the .env file path from a command, if present."""
-    # Try to find .env file paths in various positions
+# Commands that expose or modify a file named on their command line
+_READ_VERBS = ("cat", "less", "more", "head", "tail")
+_EDITOR_VERBS = ("nano", "vi", "vim", "emacs", "code", "subl", "atom", "gedit")
+_SEARCH_VERBS = ("grep", "rg", "ag", "ack")
+_WRITE_VERBS = ("tee", "cp", "mv", "touch")
+# Commands whose output can be redirected into a .env file
+_REDIRECT_VERBS = ("echo", "printf", "awk")
+# Commands also checked against a bare "env" file (no dot)
+_BARE_ENV_VERBS = ("cat", "less")
+# Regex suffixes appended to a verb. The mv pattern has always also matched
+# "mv" followed by the letters o, i and s in that order (mvi, mvs, mvois, ...),
+# so those spellings stay blocked
+_VERB_SUFFIXES = {"mv": "o?i?s?"}
+
+
+def _build_env_patterns() -> list[str]:
+    """Expand the verb tables into the regexes that indicate .env access."""
     patterns = [
-        r'(["\']?)([^\s"\']+\.[Ee][Nn][Vv])\1',  # Quoted or unquoted .env paths
-        r"\.env(?:\.\w+)?",  # .env, .env.local, .env.example, etc.
+        rf"\b{verb}{_VERB_SUFFIXES.get(verb, '')}\s+.*\.env\b"
+        for verb in _READ_VERBS + _EDITOR_VERBS + _SEARCH_VERBS + _WRITE_VERBS
     ]
+    patterns += [rf"\b{verb}\s+.*>>?\s*\.env\b" for verb in _REDIRECT_VERBS]
+    patterns += [
+        r">>?\s*\.env\b",  # Redirect or append to .env
+        r"\bsed\s+.*-i.*\.env\b",  # sed in-place editing
+        r'\bfind\s+.*-name\s+["\']?\.env',
+        # Command substitution exposing .env contents
+        r"\b(?:echo|printf)\s+.*\$\(.*cat\s+.*\.env.*\)",
+    ]
+    # Patterns without the dot (like "env" file)
+    for verb in _BARE_ENV_VERBS:
+        patterns += [rf'\b{verb}\s+["\']?env["\']?\s*$', rf'\b{verb}\s+["\']?env["\']?\s*[;&|]']
+    patterns.append(r'>>?\s*["\']?env["\']?\s*$')
+    return patterns
 
-    for pattern in patterns:
-        match = re.search(pattern, command, re.IGNORECASE)
-        if match:
-            # For patterns with groups, try to return group 2 (the actual path)
-            # For single-group patterns, return group 0 (the whole match)
-            if match.lastindex and match.lastindex >= 2:
-                return match.group(2)
-            return match.group(0)
-    return None
 
+# Patterns that indicate reading, writing, or editing .env files
+_ENV_PATTERNS = _build_env_patterns()
+
+# All patterns fused into a single alternation so one scan decides block/allow.
+# Patterns only use \s+/\s*/.* between tokens, so with DOTALL they match the raw
+# command the same way they would match a whitespace-normalized copy.
+_ENV_RE = re.compile("|".join(f"(?:{p})" for p in _ENV_PATTERNS), re.IGNORECASE | re.DOTALL)
+
+# Bare "env" file mention, used by the fast-path probe
+_BARE_ENV_RE = re.compile(r"\benv\b")
+
+# Extracts the .env file path from a matched command in one pass: a quoted or
+# unquoted path ending in .env, or a bare .env, .env.local, .env.example, etc.
+_ENV_PATH_RE = re.compile(
+    r"""["']?(?P<path>[^\s"']+\.env)["']?|(?P<bare>\.env(?:\.\w+)?)""",
+    re.IGNORECASE,
+)
 
-def _should_ignore_env_file(env_path: str, ignore_patterns: list[str] | None) -> bool:
-    """Check if an .env file path matches any ignore pattern."""
-    if not ignore_patterns:
-        return False
 
+def _extract_env_path(command: str) -> str | None:
+    """Extract the .env file path from a command, if present."""
+    match = _ENV_PATH_RE.search(command)
+    if not match:
+        return None
+    return match.group("path") or match.group("bare")
+
+
+@lru_cache(maxsize=8)
+def _compile_ignore_patterns(ignore_patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """Compile user-supplied ignore patterns once, skipping invalid regexes."""
+    compiled = []
     for pattern in ignore_patterns:
         try:
-            if re.search(pattern, env_path):
-                return True
+            compiled.append(re.compile(pattern))
         except re.error:
             # Invalid regex pattern, skip it
             continue
-    return False
+    return tuple(compiled)
+
+
+def _should_ignore_env_file(env_path: str, ignore_patterns: list[str] | None) -> bool:
+    """Check if an .env file path matches any ignore pattern."""
+    if not ignore_patterns:
+        return False
+
+    return any(pattern.search(env_path) for pattern in _compile_ignore_patterns(tuple(ignore_patterns)))
 
 
 def check_env_file_access(command):
@@ -70,93 +127,47 @@ def check_env_file_access(command):
     if not config.env_protection_enabled:
         return False, None
 
-    # Normalize the command
-    normalized_cmd = " ".join(command.strip().split())
-
-    # Patterns that indicate reading, writing, or editing .env files
-    env_patterns = [
-        # Direct file reading
-        r"\bcat\s+.*\.env\b",
-        r"\bless\s+.*\.env\b",
-        r"\bmore\s+.*\.env\b",
-        r"\bhead\s+.*\.env\b",
-        r"\btail\s+.*\.env\b",
-        # Editors - both reading and writing
-        r"\bnano\s+.*\.env\b",
-        r"\bvi\s+.*\.env\b",
-        r"\bvim\s+.*\.env\b",
-        r"\bemacs\s+.*\.env\b",
-        r"\bcode\s+.*\.env\b",
-        r"\bsubl\s+.*\.env\b",
-        r"\batom\s+.*\.env\b",
-        r"\bgedit\s+.*\.env\b",
-        # Writing/modifying .env files
-        r">\s*\.env\b",  # Redirect to .env
-        r">>\s*\.env\b",  # Append to .env
-        r"\becho\s+.*>\s*\.env\b",
-        r"\becho\s+.*>>\s*\.env\b",
-        r"\bprintf\s+.*>\s*\.env\b",
-        r"\bprintf\s+.*>>\s*\.env\b",
-        r"\bsed\s+.*-i.*\.env\b",  # sed in-place editing
-        r"\bawk\s+.*>\s*\.env\b",
-        r"\btee\s+.*\.env\b",
-        r"\bcp\s+.*\.env\b",  # Copying to .env
-        r"\bmvo?i?s?\s+.*\.env\b",  # Moving to .env
-        r"\btouch\s+.*\.env\b",  # Creating .env
-        # Searching/grepping .env files
-        r"\bgrep\s+.*\.env\b",
-        r"\bgrep\s+.*\s+\.env\b",
-        r"\brg\s+.*\.env\b",
-        r"\brg\s+.*\s+\.env\b",
-        r"\bag\s+.*\.env\b",
-        r"\back\s+.*\.env\b",
-        r'\bfind\s+.*-name\s+["\']?\.env',
-        # Other ways to expose .env contents
-        r"\becho\s+.*\$\(.*cat\s+.*\.env.*\)",
-        r"\bprintf\s+.*\$\(.*cat\s+.*\.env.*\)",
-        # Also check for patterns without the dot (like "env" file)
-        r'\bcat\s+["\']?env["\']?\s*$',
-        r'\bcat\s+["\']?env["\']?\s*[;&|]',
-        r'\bless\s+["\']?env["\']?\s*$',
-        r'\bless\s+["\']?env["\']?\s*[;&|]',
-        r'>\s*["\']?env["\']?\s*$',
-        r'>>\s*["\']?env["\']?\s*$',
-    ]
+    # Fast path: most commands never mention a .env (or bare "env") file, and
+    # a plain substring check settles that before any regex runs
+    lowered = command.lower()
+    if "env" not in lowered:
+        return False, None
+    if ".env" not in lowered and not _BARE_ENV_RE.search(lowered):
+        return False, None
 
-    # Check if any pattern matches
-    for pattern in env_patterns:
-        if re.search(pattern, normalized_cmd, re.IGNORECASE):
-            # Extract the .env path and check if it should be ignored
-            env_path = _extract_env_path(normalized_cmd)
-            if env_path and _should_ignore_env_file(env_path, config.env_protection_ignore_patterns):
-                return False, None
-
-            reason_text = (
-                "Blocked: Direct access to .env files is not allowed for security reasons.\\n\\n"
-                "• Reading .env files could expose sensitive values\\n"
-                "• Writing/editing .env files should be done manually outside Claude Code\\n\\n"
-                "For safe inspection, use the `env-safe` command:\\n"
-                " • `env-safe list` - List all environment variable keys\\n"
-                " • `env-safe list --status` - Show keys with defined/empty status\\n"
-                " • `env-safe check KEY_NAME` - Check if a specific key exists\\n"
-                " • `env-safe count` - Count variables in the file\\n"
-                " • `env-safe validate` - Check .env file syntax\\n"
-                " • `env-safe --help` - See all options\\n\\n"
-                "To modify .env files, please edit them manually outside of Claude Code."
-            )
-            return True, reason_text
+    # Single scan over the fused pattern
+    if _ENV_RE.search(command):
+        # Extract the .env path and check if it should be ignored
+        env_path = _extract_env_path(command)
+        if env_path and _should_ignore_env_file(env_path, config.env_protection_ignore_patterns):
+            return False, None
+
+        reason_text = (
+            "Blocked: Direct access to .env files is not allowed for security reasons.\\n\\n"
+            "• Reading .env files could expose sensitive values\\n"
+            "• Writing/editing .env files should be done manually outside Claude Code\\n\\n"
+            "For safe inspection, use the `env-safe` command:\\n"
+            " • `env-safe list` - List all environment variable keys\\n"
+            " • `env-safe list --status` - Show keys with defined/empty status\\n"
+            " • `env-safe check KEY_NAME` - Check if a specific key exists\\n"
+            " • `env-safe count` - Count variables in the file\\n"
+            " • `env-safe validate` - Check .env file syntax\\n"
+            " • `env-safe --help` - See all options\\n\\n"
+            "To modify .env files, please edit them manually outside of Claude Code."
+        )
+        return True, reason_text
 
     return False, None
 
 
 # If run as a standalone script
 if __name__ == "__main__":
-    data = json.load(sys.stdin)
+    data = load_hook_input()
 
     # Check if this is a Bash tool call
     tool_name = data.get("tool_name")
     if tool_name != "Bash":
-        print(json.dumps({"decision": "approve"}))
+        write_hook_output({"decision": "approve"})
         sys.exit(0)
 
     # Get the command being executed
@@ -165,8 +176,8 @@ if __name__ == "__main__":
     should_block, reason = check_env_file_access(command)
 
     if should_block:
-        print(json.dumps({"decision": "block", "reason": reason}, ensure_ascii=False))
+        write_hook_output({"decision": "block", "reason": reason})
     else:
-        print(json.dumps({"decision": "approve"}))
+        write_hook_output({"decision": "approve"})
 
     sys.exit(0)
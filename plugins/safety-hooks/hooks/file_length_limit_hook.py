@@ -13,37 +13,80 @@ Configuration via .claude-plugin/safety-hooks-config.yaml:
 - file_length_limit.extensions: File extensions to check (default: auto)
 """
 
-import json
+from __future__ import annotations
+
 import os
 import sys
-from pathlib import Path
-from typing import Any
+from functools import lru_cache
+
+# typing.Any is only used in annotations
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+from hook_io import forward_to_daemon, load_hook_input, write_hook_output
+
+
+# Import config module for runtime configuration on first use rather than at
+# module level, so a payload forwarded to the hook daemon never loads it
+def get_config():
+    """Get the runtime configuration."""
+    try:
+        from config import get_config as load_config
+    except ImportError:
+        # Fallback if config module not available
+        return _default_config()
+    return load_config()
 
-# Import config module for runtime configuration
-try:
-    from config import get_config, get_source_code_extensions  # type: ignore[no-redef]
-except ImportError:
-    # Fallback if config module not available
-    def get_config():  # type: ignore[no-redef]
-        class DefaultConfig:
-            file_length_limit_enabled = True
-            file_max_lines = 10000
-            file_extensions = None
 
-        return DefaultConfig()
+@lru_cache(maxsize=1)
+def _default_config():
+    class DefaultConfig:
+        __slots__ = ()
 
-    def get_source_code_extensions():
-        from config import DEFAULT_SOURCE_CODE_EXTENSIONS
+        file_length_limit_enabled = True
+        file_max_lines = 10000
+        file_extensions = None
 
-        return DEFAULT_SOURCE_CODE_EXTENSIONS
+    return DefaultConfig()
+
+
+def get_source_code_extensions():
+    """Get the configured source code extensions."""
+    from config import get_source_code_extensions as load_extensions
+
+    return load_extensions()
 
 
 def is_source_code_file(file_path: str) -> bool:
     """Check if file is a source code file based on extension."""
     if not file_path:
         return False
-    extensions = get_source_code_extensions()
-    return Path(file_path).suffix.lower() in extensions
+    return _has_source_extension(file_path, get_source_code_extensions())
+
+
+@lru_cache(maxsize=1024)
+def _has_source_extension(file_path: str, extensions: frozenset[str]) -> bool:
+    """Cached extension check, keyed on the extension set so config changes can't go stale."""
+    # Same suffix as Path(file_path).suffix: no dot in the directory part, and
+    # a leading dot (dotfile like ".bashrc") is not an extension
+    dot = file_path.rfind(".")
+    if dot <= file_path.rfind("/") + 1:
+        return False
+    # Suffixes longer than any known extension (logs, dated backups) can't match
+    if len(file_path) - dot > _max_extension_length(extensions):
+        return False
+    return file_path[dot:].lower() in extensions
+
+
+@lru_cache(maxsize=8)
+def _max_extension_length(extensions: frozenset[str]) -> int:
+    """Length of the longest extension in the set (including the dot)."""
+    return max(map(len, extensions), default=0)
+
+
+# Read size when streaming an existing file for Edit
+_READ_CHUNK_SIZE = 64 * 1024
 
 
 def count_lines_in_content(content: str) -> int:
@@ -53,44 +96,103 @@ def count_lines_in_content(content: str) -> int:
     return len(content.splitlines())
 
 
-def get_resulting_line_count(tool_name: str, file_path: str, tool_input: dict[str, Any]) -> int:
+def get_resulting_line_count(
+    tool_name: str, file_path: str, tool_input: dict[str, Any], max_lines: int | None = None
+) -> tuple[int, bool]:
     """
     Calculate the resulting line count after the tool operation.
     For Write: count lines in new content
     For Edit: count lines in file after replacement
+
+    Returns (line_count, exact). If max_lines is given, an Edit stops reading
+    the file as soon as the result is certain to exceed it and returns a lower
+    bound (still > max_lines) with exact=False.
     """
     if tool_name == "Write":
         # For Write, the new content is in the 'content' field
         content = tool_input.get("content", "")
-        return count_lines_in_content(content)
+        return count_lines_in_content(content), True
     elif tool_name == "Edit":
-        # For Edit, we need to calculate the result of the replacement
+        # For Edit, work out the line delta of the replacement instead of
+        # materializing the edited content
         old_string = tool_input.get("old_string", "")
         new_string = tool_input.get("new_string", "")
+        old_bytes = old_string.encode("utf-8")
+        new_bytes = new_string.encode("utf-8")
 
-        # Get current file content if it exists
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    current_content: str = f.read()
-            except Exception:
-                # If we can't read the file, assume it's safe
-                return 0
-        else:
-            # File doesn't exist yet, assume it's safe
-            return 0
-
-        # Calculate the result of the edit
         # Note: The replace_all parameter determines if all occurrences
         # are replaced
         replace_all = tool_input.get("replace_all", False)
-        if replace_all:
-            result_content = current_content.replace(old_string, new_string)
+        delta = new_bytes.count(b"\n") - old_bytes.count(b"\n")
+
+        # Once the file has more than stop_at newlines, the edit can't bring
+        # it back under max_lines (a single replacement removes at most -delta
+        # lines; replace_all can only shrink the file when delta < 0)
+        max_shrink = max(0, -delta)
+        stop_at = None
+        if max_lines is not None and (not replace_all or delta >= 0):
+            stop_at = max_lines + max_shrink
+
+        # Get current file content (as bytes, no need to decode it)
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            # File doesn't exist yet or can't be read, assume it's safe
+            return 0, True
+        chunks = []
+        newlines = 0
+        try:
+            while chunk := os.read(fd, _READ_CHUNK_SIZE):
+                # Only give up on an exact count while there is more file left to read
+                if stop_at is not None and newlines > stop_at:
+                    return newlines - max_shrink, False
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+        except OSError:
+            return 0, True
+        finally:
+            os.close(fd)
+        current_content = b"".join(chunks)
+
+        if not old_bytes:
+            occurrences = 0
+        elif replace_all:
+            occurrences = current_content.count(old_bytes)
         else:
             # Replace only first occurrence
-            result_content = current_content.replace(old_string, new_string, 1)
-        return count_lines_in_content(result_content)
-    return 0
+            occurrences = 1 if old_bytes in current_content else 0
+
+        line_count = newlines + occurrences * delta
+        if _ends_with_partial_line(current_content, old_bytes, new_bytes, replace_all):
+            line_count += 1
+        return line_count, True
+    return 0, True
+
+
+def _ends_with_partial_line(content: bytes, old: bytes, new: bytes, replace_all: bool) -> bool:
+    """
+    Check whether the edited content would end with a line lacking a trailing newline.
+    Only a replaced occurrence that ends at EOF can change the last byte.
+    """
+    end = len(content)
+    if old and content.endswith(old):
+        if replace_all:
+            # Non-overlapping occurrences, as str.replace finds them
+            starts = []
+            start = content.find(old)
+            while start != -1:
+                starts.append(start)
+                start = content.find(old, start + len(old))
+        else:
+            starts = [content.find(old)]
+        # Walk back over replaced occurrences that end where the result ends
+        for start in reversed(starts):
+            if start + len(old) != end:
+                break
+            if new:
+                return not new.endswith(b"\n")
+            end = start
+    return end > 0 and content[end - 1] != 0x0A
 
 
 def check_file_length_limit(data: dict[str, Any]) -> dict[str, str]:
@@ -120,20 +222,26 @@ def check_file_length_limit(data: dict[str, Any]) -> dict[str, str]:
         if not is_source_code_file(file_path):
             return {}
 
-        # Calculate resulting line count
-        resulting_lines: int = get_resulting_line_count(tool_name, file_path, tool_input)
-
         # Get configured max lines
         max_lines = config.file_max_lines
 
+        # Calculate resulting line count
+        resulting_lines, exact = get_resulting_line_count(tool_name, file_path, tool_input, max_lines)
+
         # If under limit, defer to system settings
         if resulting_lines <= max_lines:
             return {}
 
-        # Large file - require user approval
-        reason: str = f"""**File length limit exceeded ({resulting_lines} lines > {max_lines} lines).**
+        # Large file - require user approval. An early exit only knows a lower
+        # bound, so don't present it as the exact length
+        if exact:
+            summary = f"{resulting_lines} lines > {max_lines} lines"
+            length = f"{resulting_lines} lines"
+        else:
+            summary = length = f"more than {max_lines} lines"
+        reason: str = f"""**File length limit exceeded ({summary}).**
 
-The resulting file `{file_path}` would be {resulting_lines} lines long.
+The resulting file `{file_path}` would be {length} long.
 To maintain code quality and modularity, files should be kept under {max_lines} lines.
 
 Would you like me to:
@@ -147,24 +255,31 @@ Would you like me to:
         return {}
 
 
-# Main execution
-if __name__ == "__main__":
-    data: dict[str, Any] = json.load(sys.stdin)
+def decide(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the hook output to emit for an Edit/Write payload.
+    """
     result: dict[str, str] = check_file_length_limit(data)
 
     if result:
-        print(
-            json.dumps(
-                {
-                    "hookSpecificOutput": {
-                        "hookEventName": "PreToolUse",
-                        "permissionDecision": result.get("decision", "ask"),
-                        "permissionDecisionReason": result.get("reason", ""),
-                    }
-                }
-            )
-        )
-    else:
-        print(json.dumps({}))
+        return {
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": result.get("decision", "ask"),
+                "permissionDecisionReason": result.get("reason", ""),
+            }
+        }
+    return {}
+
+
+# Main execution
+if __name__ == "__main__":
+    data: dict[str, Any] = load_hook_input()
+
+    # Use the hook daemon when one is running, otherwise check locally
+    output = forward_to_daemon("file_length", data)
+    if output is None:
+        output = decide(data)
+    write_hook_output(output)
 
     sys.exit(0)
@@ -13,6 +13,7 @@ import os
 import re
 import subprocess
 import sys
+from functools import lru_cache
 
 # Add plugin hooks directory to Python path for local imports
 PLUGIN_ROOT = os.environ.get("CLAUDE_PLUGIN_ROOT")
@@ -21,15 +22,19 @@ if PLUGIN_ROOT:
     if hooks_dir not in sys.path:
         sys.path.insert(0, hooks_dir)
 
-from command_utils import extract_subcommands
+from command_utils import iter_subcommands
+from hook_io import load_hook_input, write_hook_output
 
 # Import config module for runtime configuration
 try:
     from config import get_config  # type: ignore[no-redef]
 except ImportError:
     # Fallback if config module not available
+    @lru_cache(maxsize=1)
     def get_config():  # type: ignore[no-redef]
         class DefaultConfig:
+            __slots__ = ()
+
             git_add_block_enabled = True
             git_allow_wildcards = False
             git_allow_dot_add = False
@@ -38,6 +43,40 @@ except ImportError:
         return DefaultConfig()
 
 
+# git commit options that supply the message or keep an existing one. --amend
+# starts from the previous message, so it is treated like one too
+_COMMIT_MESSAGE_OPTIONS = ("--message", "--file", "--reuse-message", "--no-edit", "--amend")
+# Short flags that take the message from an argument, a file, or a commit (-m, -F, -C)
+_COMMIT_MESSAGE_SHORT_FLAGS = "mFC"
+
+# git add <dir>/
+_DIR_ADD_RE = re.compile(r"git\s+add\s+(?!-)[^\s]+/$")
+
+
+# Block messages (static, so built once)
+_WILDCARD_BLOCK_REASON = """BLOCKED: Wildcard patterns are not allowed in git add!
+DO NOT use wildcards like 'git add *.py' or 'git add *'
+Instead, use:
+- 'git add <file>' to stage specific files
+- 'git ls-files -m "*.py" | xargs git add' if you really need pattern matching
+
+This restriction prevents accidentally staging unwanted files."""
+
+_HARD_BLOCK_REASON = """BLOCKED: Dangerous git add pattern detected!
+DO NOT use:
+- 'git add -A', 'git add -a', 'git add --all' (adds ALL files)
+- 'git add .' (adds entire current directory)
+- 'git add ../' or similar parent directory patterns
+- 'git add *' (wildcard patterns)
+
+Instead, use:
+- 'git add <file>' to stage specific files
+- 'git add <dir>' to stage a specific directory (with confirmation)
+- 'git add -u' to stage all modified/deleted files (but not untracked)
+
+This restriction prevents accidentally staging unwanted files."""
+
+
 def check_git_add_command(command):
     """
     Check if a git add command contains dangerous patterns.
@@ -50,10 +89,14 @@ def check_git_add_command(command):
     if not config.git_add_block_enabled:
         return False, None
 
+    # Fast path: not a git command (the add patterns are case-insensitive)
+    if "git" not in command.lower():
+        return False, None
+
     # Check each subcommand in compound commands
     # Scan ALL subcommands to ensure blocks aren't hidden after asks
     first_ask_result = None
-    for subcmd in extract_subcommands(command):
+    for subcmd in iter_subcommands(command):
         result = _check_single_git_add_command(subcmd, config)
         decision, reason = result
         # Hard blocks return immediately
@@ -70,6 +113,21 @@ def check_git_add_command(command):
     return False, None
 
 
+def _is_all_flag(token):
+    """Return True for --all or a short flag cluster containing 'a' (token is lowercased)."""
+    if token == "--all":
+        return True
+    letters = token[1:]
+    return token[:1] == "-" and "a" in letters and letters.isascii() and letters.isalpha()
+
+
+def _is_dot_target(token):
+    """Return True for '.' or a '../' parent directory path."""
+    if token == ".":
+        return True
+    return token.startswith("../") and all(c in "./_" or c.isalnum() for c in token[3:])
+
+
 def _check_single_git_add_command(command, config=None):
     """
     Check a single (non-compound) command for dangerous git add patterns.
@@ -77,90 +135,52 @@ def _check_single_git_add_command(command, config=None):
     """
     if config is None:
         config = get_config()
-    # Normalize the command - handle multiple spaces, tabs, etc.
-    normalized_cmd = " ".join(command.strip().split())
+    # Split once; the normalized string (single spaces) is for the regex checks
+    tokens = command.split()
+    normalized_cmd = " ".join(tokens)
+
+    # Everything below is anchored on a leading "git " (the -A/. checks
+    # ignore case)
+    if normalized_cmd[:4].lower() != "git ":
+        return False, None
 
     # Always allow --dry-run (used internally to detect what would be staged)
-    if "--dry-run" in normalized_cmd or "-n" in normalized_cmd.split():
+    if "--dry-run" in normalized_cmd or "-n" in tokens:
         return False, None
 
     # Pattern to match git add with problematic flags and dangerous patterns
     # Check for wildcards (if not allowed in config)
     if not config.git_allow_wildcards and "*" in normalized_cmd and normalized_cmd.startswith("git add"):
-        reason = """BLOCKED: Wildcard patterns are not allowed in git add!
-DO NOT use wildcards like 'git add *.py' or 'git add *'
-Instead, use:
-- 'git add <file>' to stage specific files
-- 'git ls-files -m "*.py" | xargs git add' if you really need pattern matching
-
-This restriction prevents accidentally staging unwanted files."""
-        return True, reason
+        return True, _WILDCARD_BLOCK_REASON
 
     # Hard block patterns: -A, --all, -a, ., ../, etc. (unless allowed in config)
-    if not config.git_allow_all_flag or not config.git_allow_dot_add:
-        patterns_to_check = []
-        if not config.git_allow_all_flag:
-            patterns_to_check.extend(
-                [
-                    r"-[a-zA-Z]*[Aa][a-zA-Z]*(\s|$)",  # Flags containing 'A' or 'a'
-                    r"--all(\s|$)",  # Long form --all
-                ]
-            )
-        if not config.git_allow_dot_add:
-            patterns_to_check.extend(
-                [
-                    r"\.(\s|$)",  # git add . (current directory)
-                    r"\.\./[.\w/]*(\s|$)",  # git add ../ or ../.. patterns
-                ]
-            )
-
-        if patterns_to_check:
-            pattern = r"^git\s+add\s+(?:.*\s+)?(" + "|".join(patterns_to_check) + r")"
-            dangerous_pattern = re.compile(pattern, re.IGNORECASE)
-
-            if dangerous_pattern.search(normalized_cmd):
-                reason = """BLOCKED: Dangerous git add pattern detected!
-DO NOT use:
-- 'git add -A', 'git add -a', 'git add --all' (adds ALL files)
-- 'git add .' (adds entire current directory)
-- 'git add ../' or similar parent directory patterns
-- 'git add *' (wildcard patterns)
-
-Instead, use:
-- 'git add <file>' to stage specific files
-- 'git add <dir>' to stage a specific directory (with confirmation)
-- 'git add -u' to stage all modified/deleted files (but not untracked)
-
-This restriction prevents accidentally staging unwanted files."""
-                return True, reason
+    # One pass over the arguments, each lowercased once since these ignore case
+    if tokens[1].lower() == "add":
+        for token in tokens[2:]:
+            token = token.lower()
+            if (not config.git_allow_all_flag and _is_all_flag(token)) or (
+                not config.git_allow_dot_add and _is_dot_target(token)
+            ):
+                return True, _HARD_BLOCK_REASON
 
     # Check for git add with a directory
-    # Match: git add <dir>/ or git add <dir>/
-    directory_pattern = re.compile(r"^git\s+add\s+(?!-)[^\s]+/$")
-    match = directory_pattern.search(normalized_cmd)
-
-    if match:
+    # Match: git add <dir>/ (only possible when the command ends with "/")
+    if normalized_cmd.endswith("/") and _DIR_ADD_RE.match(normalized_cmd):
         # Extract the directory path from the command
-        parts = normalized_cmd.split()
         dir_path = None
-        for i, part in enumerate(parts):
-            if i > 0 and parts[i - 1] == "add" and part.endswith("/"):
+        for i, part in enumerate(tokens):
+            if i > 0 and tokens[i - 1] == "add" and part.endswith("/"):
                 dir_path = part.rstrip("/")
                 break
 
         if dir_path:
             # Use dry-run to get files that would be staged
             try:
-                result = subprocess.run(
-                    ["git", "add", "--dry-run", dir_path + "/"],
-                    capture_output=True,
-                    text=True,
-                    cwd=os.getcwd(),
-                )
+                output = _run_git(["add", "--dry-run", dir_path + "/"])
 
                 # Parse dry-run output: "add 'filename'" lines
                 files = []
-                for line in result.stdout.strip().split("\n"):
+                for line in output.strip().split("\n"):
                     if line.startswith("add "):
                         # Extract filename from "add 'filename'"
                         fname = line[4:].strip().strip("'")
@@ -170,20 +190,8 @@ This restriction prevents accidentally staging unwanted files."""
                     # No files to stage
                     return False, None
 
-                # Check which files are modified vs new
-                modified_files = []
-                new_files = []
-                for f in files:
-                    status_result = subprocess.run(
-                        ["git", "status", "--porcelain", f], capture_output=True, text=True, cwd=os.getcwd()
-                    )
-                    status = status_result.stdout.strip()
-                    if status:
-                        status_code = status[:2]
-                        if "?" in status_code:
-                            new_files.append(f)
-                        else:
-                            modified_files.append(f)
+                # Check for tracked changes (not new files) under the directory
+                modified_files = get_tracked_changes([dir_path + "/"])
 
                 # If only new files, allow without permission
                 if not modified_files:
@@ -203,9 +211,12 @@ This restriction prevents accidentally staging unwanted files."""
 
     # Also check for git commit -a without -m (which would open an editor)
     # Check if command has -a flag but no -m flag
-    if re.search(r"^git\s+commit\s+", normalized_cmd):
-        has_a_flag = re.search(r"-[a-zA-Z]*a[a-zA-Z]*", normalized_cmd)
-        has_m_flag = re.search(r"-[a-zA-Z]*m[a-zA-Z]*", normalized_cmd)
+    if normalized_cmd.startswith("git commit "):
+        short_flags = [t for t in tokens[2:] if t.startswith("-") and not t.startswith("--")]
+        has_a_flag = "--all" in tokens or any("a" in t for t in short_flags)
+        has_m_flag = any(t.startswith(_COMMIT_MESSAGE_OPTIONS) for t in tokens) or any(
+            flag in t for t in short_flags for flag in _COMMIT_MESSAGE_SHORT_FLAGS
+        )
         if has_a_flag and not has_m_flag:
             reason = """Avoid 'git commit -a' without a message flag. Use 'gcam "message"' instead, which is an alias for 'git commit -a -m'."""
             return True, reason
@@ -213,7 +224,7 @@ This restriction prevents accidentally staging unwanted files."""
     # Check if staging modified files (not new/untracked) - requires permission
     # This check runs after all blocking patterns pass
     if normalized_cmd.startswith("git add"):
-        modified_files = get_modified_files_being_staged(normalized_cmd)
+        modified_files = get_modified_files_being_staged(tokens)
         if modified_files:
             file_list = ", ".join(modified_files[:5])
             if len(modified_files) > 5:
@@ -224,55 +235,71 @@ This restriction prevents accidentally staging unwanted files."""
     return False, None
 
 
-def get_modified_files_being_staged(command):
+def _run_git(args):
+    """
+    Run git with the given arguments in the current directory and return its stdout.
+    stderr is discarded, so only one pipe has to be drained.
+    """
+    proc = subprocess.Popen(
+        ["git", *args], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=False
+    )
+    stdout, _ = proc.communicate()
+    return os.fsdecode(stdout)
+
+
+def get_modified_files_being_staged(tokens):
     """
-    Extract files from git add command and return those that are modified
-    (not new/untracked). Returns empty list if only staging new files.
+    Extract files from the tokens of a git add command and return the modified
+    (not new/untracked) files under them. Returns empty list if only staging new files.
     """
-    parts = command.split()
-    if len(parts) < 3 or parts[0] != "git" or parts[1] != "add":
+    if len(tokens) < 3 or tokens[0] != "git" or tokens[1] != "add":
         return []
 
     # Extract file arguments (skip 'git add' and any flags)
     files = []
-    for part in parts[2:]:
+    for part in tokens[2:]:
         if not part.startswith("-"):
             files.append(part)
 
     if not files:
         return []
 
-    modified_files = []
-    for f in files:
-        try:
-            # Check git status for this file
-            result = subprocess.run(
-                ["git", "status", "--porcelain", f], capture_output=True, text=True, cwd=os.getcwd()
-            )
-            status = result.stdout.strip()
-            if status:
-                # Status codes: ?? = untracked, M = modified, A = staged
-                # We want to flag modified files (not untracked)
-                status_code = status[:2]
-                if "?" not in status_code:  # Not untracked = modified/staged
-                    modified_files.append(f)
-        except Exception:
-            pass
-
-    return modified_files
+    try:
+        return get_tracked_changes(files)
+    except Exception:
+        return []
+
+
+def get_tracked_changes(pathspecs):
+    """
+    Return paths with staged or unstaged changes to tracked files under the
+    given pathspecs, using a single `git status` call. Untracked files are
+    excluded. Paths are relative to the repository root.
+    """
+    output = _run_git(["status", "--porcelain", "-z", "--untracked-files=no", "--", *pathspecs])
+
+    # Entries are "XY path\0"; renames and copies add the source path as an extra field
+    changed = []
+    fields = iter(output.split("\0"))
+    for entry in fields:
+        if len(entry) < 4:
+            continue
+        status_code = entry[:2]
+        changed.append(entry[3:])
+        if "R" in status_code or "C" in status_code:
+            next(fields, None)
+
+    return changed
 
 
 # If run as a standalone script
 if __name__ == "__main__":
-    import json
-    import sys
-
-    data = json.load(sys.stdin)
+    data = load_hook_input()
 
     # Check if this is a Bash tool call
     tool_name = data.get("tool_name")
     if tool_name != "Bash":
-        print(json.dumps({"decision": "approve"}))
+        write_hook_output({"decision": "approve"})
         sys.exit(0)
 
     # Get the command being executed
@@ -281,8 +308,8 @@ if __name__ == "__main__":
     should_block, reason = check_git_add_command(command)
 
     if should_block:
-        print(json.dumps({"decision": "block", "reason": reason}))
+        write_hook_output({"decision": "block", "reason": reason})
     else:
-        print(json.dumps({"decision": "approve"}))
+        write_hook_output({"decision": "approve"})
 
     sys.exit(0)
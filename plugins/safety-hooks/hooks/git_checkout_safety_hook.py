@@ -12,6 +12,7 @@ import os
 import re
 import subprocess
 import sys
+from functools import lru_cache
 
 # Add plugin hooks directory to Python path for local imports
 PLUGIN_ROOT = os.environ.get("CLAUDE_PLUGIN_ROOT")
@@ -20,15 +21,19 @@ if PLUGIN_ROOT:
     if hooks_dir not in sys.path:
         sys.path.insert(0, hooks_dir)
 
-from command_utils import extract_subcommands
+from command_utils import iter_subcommands
+from hook_io import load_hook_input, write_hook_output
 
 # Import config module for runtime configuration
 try:
     from config import get_config  # type: ignore[no-redef]
 except ImportError:
     # Fallback if config module not available
+    @lru_cache(maxsize=1)
     def get_config():  # type: ignore[no-redef]
         class DefaultConfig:
+            __slots__ = ()
+
             git_checkout_block_enabled = True
             git_checkout_force_protection = True
             git_checkout_dot_protection = True
@@ -36,6 +41,42 @@ except ImportError:
         return DefaultConfig()
 
 
+# Patterns are searched anywhere in the subcommand: iter_subcommands does not split
+# on "|", so a dangerous checkout can follow a safe one (git checkout x | git checkout -f)
+
+# Force flag protection
+_FORCE_PATTERNS = (
+    (
+        re.compile(r"\bgit\s+checkout\s+(-f|--force)\b"),
+        "'git checkout -f' FORCES checkout and DISCARDS all uncommitted changes!",
+    ),
+)
+
+# Dot protection
+_DOT_PATTERNS = (
+    (
+        re.compile(r"\bgit\s+checkout\s+\."),
+        "'git checkout .' will DISCARD ALL changes in current directory!",
+    ),
+    (
+        re.compile(r"\bgit\s+checkout\s+.*\s+--\s+\."),
+        "This will DISCARD ALL changes in current directory!",
+    ),
+    (
+        re.compile(r"\bgit\s+checkout\s+.*\s+--\s+"),
+        "This will overwrite your local file with version from another branch/commit!",
+    ),
+)
+
+# Dangerous patterns keyed on (force_protection, dot_protection)
+_DANGEROUS_PATTERNS = {
+    (True, True): _FORCE_PATTERNS + _DOT_PATTERNS,
+    (True, False): _FORCE_PATTERNS,
+    (False, True): _DOT_PATTERNS,
+    (False, False): (),
+}
+
+
 def check_git_checkout_command(command):
     """
     Check if a git checkout command is safe to execute.
@@ -48,8 +89,12 @@ def check_git_checkout_command(command):
     if not config.git_checkout_block_enabled:
         return False, None
 
+    # Fast path: not a git command
+    if "git" not in command:
+        return False, None
+
     # Check each subcommand in compound commands
-    for subcmd in extract_subcommands(command):
+    for subcmd in iter_subcommands(command):
         result = _check_single_git_checkout_command(subcmd, config)
         should_block, reason = result
         if should_block:
@@ -67,40 +112,21 @@ def _check_single_git_checkout_command(command, config=None):
         config = get_config()
 
     # Check if it's a git checkout command
-    if not command.strip().startswith("git checkout"):
+    command = command.strip()
+    if not command.startswith("git checkout"):
         return False, None
 
     # Safe patterns that we should allow without checking
     if "-b" in command or "--help" in command or "-h" in command:
         return False, None
 
-    # Build dangerous patterns list based on config
-    dangerous_patterns = []
-
-    # Force flag protection (if enabled)
-    if config.git_checkout_force_protection:
-        dangerous_patterns.append(
-            (
-                r"\bgit\s+checkout\s+(-f|--force)\b",
-                "'git checkout -f' FORCES checkout and DISCARDS all uncommitted changes!",
-            )
-        )
-
-    # Dot protection (if enabled)
-    if config.git_checkout_dot_protection:
-        dangerous_patterns.extend(
-            [
-                (r"\bgit\s+checkout\s+\.", "'git checkout .' will DISCARD ALL changes in current directory!"),
-                (r"\bgit\s+checkout\s+.*\s+--\s+\.", "This will DISCARD ALL changes in current directory!"),
-                (
-                    r"\bgit\s+checkout\s+.*\s+--\s+",
-                    "This will overwrite your local file with version from another branch/commit!",
-                ),
-            ]
-        )
+    # Pick the precompiled dangerous patterns for the enabled protections
+    dangerous_patterns = _DANGEROUS_PATTERNS[
+        bool(config.git_checkout_force_protection), bool(config.git_checkout_dot_protection)
+    ]
 
     for pattern, message in dangerous_patterns:
-        if re.search(pattern, command):
+        if pattern.search(command):
             reason = f"⚠️ DANGEROUS COMMAND DETECTED!\\n\\n{message}\\n\\nThis command will destroy uncommitted work without warning.\\n\\nSafer alternatives:\\n- Use 'git stash' to save changes temporarily\\n- Use 'git diff' to see what would be lost\\n- Use 'git restore' for clearer syntax"
             return True, reason
 
@@ -109,23 +135,25 @@ def _check_single_git_checkout_command(command, config=None):
         status_result = subprocess.run(
             ["git", "status", "--porcelain"], capture_output=True, text=True, cwd=os.getcwd()
         )
-        has_changes = bool(status_result.stdout.strip())
 
-        # Get more detailed status if there are changes
-        if has_changes:
-            # Count changes
-            all_changes = status_result.stdout.strip().split("\n")
-            modified_files = [f for f in all_changes if f.strip()]
-            num_changes = len(modified_files)
+        # Count changes in one pass, keeping only the first 10 to show
+        num_changes = 0
+        shown_changes = []
+        for line in status_result.stdout.splitlines():
+            if line.strip():
+                num_changes += 1
+                if len(shown_changes) < 10:
+                    shown_changes.append(line)
 
+        # Get more detailed status if there are changes
+        if num_changes:
             # Build warning message
             warning = f"WARNING: You have {num_changes} uncommitted change(s) that may be lost!\\n\\n"
-            if modified_files:
-                warning += "Modified files:\\n"
-                for change in modified_files[:10]:  # Show first 10
-                    warning += f" {change}\\n"
-                if num_changes > 10:
-                    warning += f" ... and {num_changes - 10} more\\n"
+            warning += "Modified files:\\n"
+            for change in shown_changes:
+                warning += f" {change}\\n"
+            if num_changes > 10:
+                warning += f" ... and {num_changes - 10} more\\n"
             warning += "\\nOptions:\\n"
             warning += "1. Stash changes: git stash\\n"
             warning += "2. Commit changes: git commit -am 'your message'\\n"
@@ -148,15 +176,12 @@ def _check_single_git_checkout_command(command, config=None):
 
 # If run as a standalone script
 if __name__ == "__main__":
-    import json
-    import sys
-
-    data = json.load(sys.stdin)
+    data = load_hook_input()
 
     # Check if this is a Bash tool call
     tool_name = data.get("tool_name")
     if tool_name != "Bash":
-        print(json.dumps({"decision": "approve"}))
+        write_hook_output({"decision": "approve"})
         sys.exit(0)
 
     # Get the command being executed
@@ -165,8 +190,8 @@ if __name__ == "__main__":
     should_block, reason = check_git_checkout_command(command)
 
     if should_block:
-        print(json.dumps({"decision": "block", "reason": reason}))
+        write_hook_output({"decision": "block", "reason": reason})
     else:
-        print(json.dumps({"decision": "approve"}))
+        write_hook_output({"decision": "approve"})
 
     sys.exit(0)
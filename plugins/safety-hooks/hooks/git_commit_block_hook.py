@@ -7,9 +7,9 @@ Configuration via .claude-plugin/safety-hooks-config.yaml:
 - enabled_hooks.git_commit_ask: Enable/disable this hook
 """
 
-import json
 import os
 import sys
+from functools import lru_cache
 
 # Add plugin hooks directory to Python path for local imports
 PLUGIN_ROOT = os.environ.get("CLAUDE_PLUGIN_ROOT")
@@ -18,15 +18,19 @@ if PLUGIN_ROOT:
     if hooks_dir not in sys.path:
         sys.path.insert(0, hooks_dir)
 
-from command_utils import extract_subcommands
+from command_utils import iter_subcommands
+from hook_io import load_hook_input, write_hook_output
 
 # Import config module for runtime configuration
 try:
     from config import get_config  # type: ignore[no-redef]
 except ImportError:
     # Fallback if config module not available
+    @lru_cache(maxsize=1)
     def get_config():  # type: ignore[no-redef]
         class DefaultConfig:
+            __slots__ = ()
+
             git_commit_ask_enabled = True
 
         return DefaultConfig()
@@ -45,8 +49,12 @@ def check_git_commit_command(command):
     if not config.git_commit_ask_enabled:
         return "allow", None
 
+    # Fast path: not a git command
+    if "git" not in command:
+        return "allow", None
+
     # Check each subcommand in compound commands
-    for subcmd in extract_subcommands(command):
+    for subcmd in iter_subcommands(command):
         normalized = " ".join(subcmd.strip().split())
         if normalized.startswith("git commit"):
             reason = "Git commit requires your approval."
@@ -57,12 +65,12 @@ def check_git_commit_command(command):
 
 # If run as a standalone script
 if __name__ == "__main__":
-    data = json.load(sys.stdin)
+    data = load_hook_input()
 
     # Check if this is a Bash tool call
     tool_name = data.get("tool_name")
     if tool_name != "Bash":
-        print(json.dumps({"decision": "approve"}))
+        write_hook_output({"decision": "approve"})
         sys.exit(0)
 
     # Get the command being executed
@@ -71,30 +79,26 @@ if __name__ == "__main__":
     decision, reason = check_git_commit_command(command)
 
     if decision == "ask":
-        print(
-            json.dumps(
-                {
-                    "hookSpecificOutput": {
-                        "hookEventName": "PreToolUse",
-                        "permissionDecision": "ask",
-                        "permissionDecisionReason": reason,
-                    }
+        write_hook_output(
+            {
+                "hookSpecificOutput": {
+                    "hookEventName": "PreToolUse",
+                    "permissionDecision": "ask",
+                    "permissionDecisionReason": reason,
                 }
-            )
+            }
         )
     elif decision == "block":
-        print(
-            json.dumps(
-                {
-                    "hookSpecificOutput": {
-                        "hookEventName": "PreToolUse",
-                        "permissionDecision": "deny",
-                        "permissionDecisionReason": reason,
-                    }
+        write_hook_output(
+            {
+                "hookSpecificOutput": {
+                    "hookEventName": "PreToolUse",
+                    "permissionDecision": "deny",
+                    "permissionDecisionReason": reason,
                 }
-            )
+            }
         )
     else:
-        print(json.dumps({"decision": "approve"}))
+        write_hook_output({"decision": "approve"})
 
     sys.exit(0)
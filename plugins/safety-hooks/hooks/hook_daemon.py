@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Optional long-lived server for the safety hooks.
+
+Every hook invocation normally starts a new python3 process that imports all
+hook modules, compiles their patterns and loads the config. Start this daemon
+once and export SAFETY_HOOK_SOCK with its socket path: bash_hook.py and
+file_length_limit_hook.py then forward their payload to it, and check it
+themselves only if the daemon cannot be reached.
+
+Usage: python3 hook_daemon.py [socket_path]   (default: $SAFETY_HOOK_SOCK)
+
+Protocol: one JSON line {"hook": "bash" | "file_length", "cwd": ..., "payload": {...}}
+per connection, answered with one JSON line {"result": {...}} or {"error": "..."}.
+Requests are handled one at a time because each runs in the caller's cwd.
+"""
+
+import os
+import socketserver
+import stat
+import sys
+
+# Add hooks directory to Python path so we can import the other modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bash_hook
+import file_length_limit_hook
+from config import clear_config_cache
+from hook_io import DAEMON_SOCKET_ENV_VAR, dumps, loads
+
+# Hook name -> function turning a payload into the hook output
+HOOKS = {
+    "bash": bash_hook.decide,
+    "file_length": file_length_limit_hook.decide,
+}
+
+
+class HookRequestHandler(socketserver.StreamRequestHandler):
+    """Answer a single hook request."""
+
+    def handle(self):
+        try:
+            request = loads(self.rfile.readline())
+            # Hooks resolve git state and the project config from the cwd
+            os.chdir(request["cwd"])
+            clear_config_cache()
+            response = {"result": HOOKS[request["hook"]](request["payload"])}
+        except Exception as e:
+            response = {"error": str(e)}
+        self.wfile.write(dumps(response))
+
+
+def _remove_stale_socket(path):
+    """Remove a socket left behind by a previous daemon; refuse to touch other files."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise SystemExit(f"{path} exists and is not a socket")
+    os.unlink(path)
+
+
+def main(argv):
+    socket_path = argv[1] if len(argv) > 1 else os.environ.get(DAEMON_SOCKET_ENV_VAR)
+    if not socket_path:
+        print(f"usage: {argv[0]} SOCKET_PATH (or set {DAEMON_SOCKET_ENV_VAR})", file=sys.stderr)
+        return 2
+
+    _remove_stale_socket(socket_path)
+    # Only the current user may connect to the socket
+    os.umask(0o077)
+    with socketserver.UnixStreamServer(socket_path, HookRequestHandler) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,92 @@
+"""Shared stdin/stdout JSON handling for hook entry points.
+
+Hook payloads are read from stdin as bytes and results written to stdout as
+one JSON line, using orjson when it is installed and the stdlib json module
+otherwise.
+
+If SAFETY_HOOK_SOCK points at a running hook_daemon.py, entry points can hand
+their payload to it with forward_to_daemon() instead of checking it themselves.
+"""
+
+import json
+import os
+import sys
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None
+
+# Reused for every stdlib dump instead of building an encoder per call
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# The most common hook result, serialized once
+_APPROVE = {"decision": "approve"}
+_APPROVE_OUT = b'{"decision":"approve"}\n'
+
+# Environment variable holding the unix socket path of a running hook daemon
+DAEMON_SOCKET_ENV_VAR = "SAFETY_HOOK_SOCK"
+
+# Well under the 10s hook timeout in hooks.json, leaving time for a local fallback
+_DAEMON_TIMEOUT = 5
+
+
+def loads(payload: bytes) -> dict:
+    """Parse a JSON document from bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # orjson rejects valid JSON that stdlib json accepts, such as lone
+            # surrogate escapes ("\ud800"); never let that skip the checks
+            pass
+    return json.loads(payload)
+
+
+def dumps(obj: dict) -> bytes:
+    """Serialize obj as one newline-terminated JSON line."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates in a reason; handled below
+    try:
+        return _JSON_ENCODER.encode(obj).encode("utf-8") + b"\n"
+    except UnicodeEncodeError:
+        # Lone surrogates cannot be written as UTF-8, so escape everything
+        return json.dumps(obj).encode("ascii") + b"\n"
+
+
+def load_hook_input() -> dict:
+    """Parse the hook payload from stdin."""
+    return loads(sys.stdin.buffer.read())
+
+
+def write_hook_output(result: dict) -> None:
+    """Write the hook result to stdout as one JSON line."""
+    sys.stdout.buffer.write(_APPROVE_OUT if result == _APPROVE else dumps(result))
+
+
+def forward_to_daemon(hook: str, payload: dict) -> dict | None:
+    """
+    Ask the hook daemon for the result of `hook` on `payload`.
+    Returns None if no daemon is configured or it could not answer, in which
+    case the caller should run the check itself.
+    """
+    socket_path = os.environ.get(DAEMON_SOCKET_ENV_VAR)
+    if not socket_path:
+        return None
+
+    import socket
+
+    request = {"hook": hook, "cwd": os.getcwd(), "payload": payload}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_DAEMON_TIMEOUT)
+            sock.connect(socket_path)
+            sock.sendall(dumps(request))
+            sock.shutdown(socket.SHUT_WR)
+            response = b"".join(iter(lambda: sock.recv(65536), b""))
+        return loads(response)["result"]
+    except Exception:
+        return None
@@ -9,19 +9,22 @@ Configuration via .claude-plugin/safety-hooks-config.yaml:
 - rm_block.log_file: Name of log file for trashed files (default: "TRASH-FILES.md")
 """
 
-import json
 import os
-import re
 import sys
-from pathlib import Path
+from functools import lru_cache
+
+from hook_io import load_hook_input, write_hook_output
 
 # Import config module for runtime configuration
 try:
     from config import get_config  # type: ignore[no-redef]
 except ImportError:
     # Fallback if config module not available
+    @lru_cache(maxsize=1)
     def get_config():  # type: ignore[no-redef]
         class DefaultConfig:
+            __slots__ = ()
+
             rm_block_enabled = True
             rm_trash_dir = "TRASH"
             rm_require_log = True
@@ -30,6 +33,10 @@ except ImportError:
         return DefaultConfig()
 
 
+# (cwd, trash_dir, log_file) combinations whose .gitignore is already handled
+_GITIGNORE_ENSURED: set[tuple[str, str, str]] = set()
+
+
 def ensure_gitignore_entries(cwd, trash_dir, log_file):
     """
     Add TRASH directory and log file to .gitignore at the repository root
@@ -42,54 +49,55 @@ def ensure_gitignore_entries(cwd, trash_dir, log_file):
     # Find the git repository root
     repo_root = None
     try:
-        current = Path(cwd).resolve()
+        current = os.path.realpath(cwd)
+        state_key = (current, trash_dir, log_file)
+        if state_key in _GITIGNORE_ENSURED:
+            return  # Already handled for this directory in this process
         for _ in range(50):  # Limit parent traversal to avoid infinite loops
-            if (current / ".git").exists():
+            # .git is a file rather than a directory in worktrees and submodules
+            if os.path.exists(os.path.join(current, ".git")):
                 repo_root = current
                 break
-            if current.parent == current:  # Reached filesystem root
+            parent = os.path.dirname(current)
+            if parent == current:  # Reached filesystem root
                 break
-            current = current.parent
+            current = parent
     except (OSError, PermissionError):
-        pass  # Cannot determine git status
+        return  # Cannot determine git status
 
     if not repo_root:
+        _GITIGNORE_ENSURED.add(state_key)
         return  # Not in a git repo, nothing to do
 
-    gitignore_path = repo_root / ".gitignore"
+    gitignore_path = os.path.join(repo_root, ".gitignore")
+
+    # Read existing .gitignore once, if it exists
+    try:
+        with open(gitignore_path, "rb") as f:
+            content = f.read().decode("utf-8")
+    except FileNotFoundError:
+        content = ""
+    except (OSError, PermissionError, UnicodeDecodeError):
+        return  # Cannot read .gitignore, skip
 
-    # Read existing .gitignore if it exists
-    existing_entries = set()
-    if gitignore_path.exists():
-        try:
-            with open(gitignore_path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        existing_entries.add(line)
-        except (OSError, PermissionError, UnicodeDecodeError):
-            return  # Cannot read .gitignore, skip
+    existing_entries = frozenset(
+        entry for entry in map(str.strip, content.splitlines()) if entry and not entry.startswith("#")
+    )
 
     # Check if entries already exist (with or without trailing slash)
-    trash_variations = {trash_dir, f"{trash_dir}/"}
-
-    needs_trash = not any(v in existing_entries for v in trash_variations)
+    needs_trash = existing_entries.isdisjoint((trash_dir, f"{trash_dir}/"))
     needs_log = log_file not in existing_entries
 
     if not needs_trash and not needs_log:
+        _GITIGNORE_ENSURED.add(state_key)
         return  # Already configured
 
     # Append missing entries
     try:
         with open(gitignore_path, "a", encoding="utf-8") as f:
             # Add newline if file doesn't end with one
-            if gitignore_path.exists() and gitignore_path.stat().st_size > 0:
-                f.seek(0, 2)  # Seek to end
-                if f.tell() > 0:
-                    f.seek(f.tell() - 1)
-                    last_char = f.read(1)
-                    if last_char not in ("\n", "\r"):
-                        f.write("\n")
+            if content and content[-1] not in ("\n", "\r"):
+                f.write("\n")
 
             f.write("\n# Safety-hooks: TRASH directory and log file (anywhere in repo)\n")
             if needs_trash:
@@ -97,7 +105,74 @@ def ensure_gitignore_entries(cwd, trash_dir, log_file):
             if needs_log:
                 f.write(f"{log_file}\n")
     except (OSError, PermissionError):
-        pass  # Silently fail if we cannot write
+        return  # Silently fail if we cannot write
+    _GITIGNORE_ENSURED.add(state_key)
+
+
+# Shell operators that start a new command
+_COMMAND_SEPARATORS = ";&|"
+
+
+def _is_rm_token(token):
+    """Check if a token invokes rm, bare or by absolute path (e.g. /bin/rm)."""
+    if token.startswith("/"):
+        token = token[token.rfind("/") + 1 :]
+    # "rm" not followed by a word character, so rmdir/rmtrash don't count
+    if not token.startswith("rm"):
+        return False
+    next_char = token[2:3]
+    return not (next_char.isalnum() or next_char == "_")
+
+
+def _starts_with_rm(command, start):
+    """Check if the word at command[start:] (after whitespace, ending at whitespace or a separator) invokes rm."""
+    end = len(command)
+    # Walk by index rather than slicing, so each separator costs only its own word
+    while start < end and command[start].isspace():
+        start += 1
+    # Cheap reject before scanning the word: it must be rm or /.../rm
+    if not command.startswith(("rm", "/"), start):
+        return False
+    stop = start
+    while stop < end and not command[stop].isspace() and command[stop] not in _COMMAND_SEPARATORS:
+        stop += 1
+    return _is_rm_token(command[start:stop])
+
+
+def _has_rm_command(command):
+    """Check if rm is the first word of the command or of any ;/&/| separated part."""
+    if _starts_with_rm(command, 0):
+        return True
+    for sep in _COMMAND_SEPARATORS:
+        pos = command.find(sep)
+        while pos != -1:
+            if _starts_with_rm(command, pos + 1):
+                return True
+            pos = command.find(sep, pos + 1)
+    return False
+
+
+@lru_cache(maxsize=8)
+def _rm_reason(require_log, trash_dir, log_file):
+    """Build the block message for rm, once per config combination."""
+    if require_log:
+        return (
+            f"Instead of using 'rm':\\n"
+            f"- MOVE files using `mv` to the {trash_dir} directory in the CURRENT folder "
+            f"(create it if needed), \\n"
+            f"- Add an entry in a markdown file called '{log_file}' in the current directory, "
+            f" where you show a one-liner with the file name, where it moved, and the reason to trash it, "
+            f"e.g.:\\n\\n"
+            "```\\n"
+            "test_script.py - moved to TRASH/ - temporary test script\\n"
+            "data/junk.txt - moved to TRASH/ - data file we don't need\\n"
+            "```"
+        )
+    return (
+        f"Instead of using 'rm':\\n"
+        f"- MOVE files using `mv` to the {trash_dir} directory in the CURRENT folder "
+        f"(create it if needed)"
+    )
 
 
 def check_rm_command(command, cwd=None):
@@ -106,22 +181,19 @@ def check_rm_command(command, cwd=None):
     Returns tuple: (should_block: bool, reason: str or None)
     Returns (False, None) if hook is disabled.
     """
+    # Fast path: every rm form below contains "rm", so most commands never load config
+    if "rm" not in command:
+        return False, None
+
     # Load config to check if hook is enabled
     config = get_config()
     if not config.rm_block_enabled:
         return False, None
 
-    # Normalize the command
-    normalized_cmd = " ".join(command.strip().split())
-
     # Check if it's an rm command
-    # This catches: rm, /bin/rm, /usr/bin/rm, etc.
-    # Also simpler check: if the command starts with rm or contains rm after common separators
-    if (
-        normalized_cmd.startswith("rm ")
-        or normalized_cmd == "rm"
-        or re.search(r"(^|[;&|]\s*)(/\S*/)?rm\b", normalized_cmd)
-    ):
+    # This catches: rm, /bin/rm, /usr/bin/rm, etc., at the start or after common separators
+    # (whitespace is skipped by the scan, so the command needs no normalizing)
+    if _has_rm_command(command):
         trash_dir = config.rm_trash_dir
         log_file = config.rm_log_file
 
@@ -129,38 +201,19 @@ def check_rm_command(command, cwd=None):
         if cwd:
             ensure_gitignore_entries(cwd, trash_dir, log_file)
 
-        if config.rm_require_log:
-            reason_text = (
-                f"Instead of using 'rm':\\n"
-                f"- MOVE files using `mv` to the {trash_dir} directory in the CURRENT folder "
-                f"(create it if needed), \\n"
-                f"- Add an entry in a markdown file called '{log_file}' in the current directory, "
-                f" where you show a one-liner with the file name, where it moved, and the reason to trash it, "
-                f"e.g.:\\n\\n"
-                "```\\n"
-                "test_script.py - moved to TRASH/ - temporary test script\\n"
-                "data/junk.txt - moved to TRASH/ - data file we don't need\\n"
-                "```"
-            )
-        else:
-            reason_text = (
-                f"Instead of using 'rm':\\n"
-                f"- MOVE files using `mv` to the {trash_dir} directory in the CURRENT folder "
-                f"(create it if needed)"
-            )
-        return True, reason_text
+        return True, _rm_reason(config.rm_require_log, trash_dir, log_file)
 
     return False, None
 
 
 # If run as a standalone script
 if __name__ == "__main__":
-    data = json.load(sys.stdin)
+    data = load_hook_input()
 
     # Check if this is a Bash tool call
     tool_name = data.get("tool_name")
     if tool_name != "Bash":
-        print(json.dumps({"decision": "approve"}))
+        write_hook_output({"decision": "approve"})
         sys.exit(0)
 
     # Get the command being executed and current working directory
@@ -170,8 +223,8 @@ if __name__ == "__main__":
     should_block, reason = check_rm_command(command, cwd)
 
     if should_block:
-        print(json.dumps({"decision": "block", "reason": reason}, ensure_ascii=False))
+        write_hook_output({"decision": "block", "reason": reason})
     else:
-        print(json.dumps({"decision": "approve"}))
+        write_hook_output({"decision": "approve"})
 
     sys.exit(0)
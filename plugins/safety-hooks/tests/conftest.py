@@ -12,7 +12,7 @@ if str(HOOKS_DIR) not in sys.path:
     sys.path.insert(0, str(HOOKS_DIR))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
     """Return a mock SafetyHooksConfig with customizable values."""
 
@@ -56,7 +56,7 @@ def mock_get_config(mock_config):
     return _get_config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_hook_input():
     """Return a sample hook input dict."""
 
@@ -74,55 +74,55 @@ def sample_hook_input():
     return _input
 
 
+def _git_result(stdout: str = "") -> MagicMock:
+    """Build a fresh subprocess result mock, so no call records are shared between tests."""
+    return MagicMock(stdout=stdout, stderr="", returncode=0)
+
+
 @pytest.fixture
 def mock_git_subprocess():
     """Mock subprocess.run for git commands.
 
     Returns a MagicMock that can be configured to return different results.
     """
-    mock_result = MagicMock()
-    mock_result.stdout = ""
-    mock_result.stderr = ""
-    mock_result.returncode = 0
+    mock_result = _git_result()
 
     with patch("subprocess.run", return_value=mock_result) as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_git_status_clean(mock_git_subprocess):
+def mock_run_git():
+    """Mock the git add hook's _run_git helper, which runs git through subprocess.Popen.
+
+    The mock's return_value is the stdout of the git command.
+    """
+    with patch("git_add_block_hook._run_git", return_value="") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_git_status_clean(mock_run_git):
     """Mock git status returning no changes."""
-    mock_result = MagicMock()
-    mock_result.stdout = ""
-    mock_result.returncode = 0
-    mock_git_subprocess.return_value = mock_result
+    mock_run_git.return_value = ""
 
 
 @pytest.fixture
-def mock_git_status_dirty(mock_git_subprocess):
+def mock_git_status_dirty(mock_run_git):
     """Mock git status returning changes."""
-    mock_result = MagicMock()
-    mock_result.stdout = "M  file1.py\nM  file2.py\n"
-    mock_result.returncode = 0
-    mock_git_subprocess.return_value = mock_result
+    mock_run_git.return_value = "M  file1.py\0M  file2.py\0"
 
 
 @pytest.fixture
-def mock_git_dry_run_no_files(mock_git_subprocess):
+def mock_git_dry_run_no_files(mock_run_git):
     """Mock git add --dry-run returning no files."""
-    mock_result = MagicMock()
-    mock_result.stdout = ""
-    mock_result.returncode = 0
-    mock_git_subprocess.return_value = mock_result
+    mock_run_git.return_value = ""
 
 
 @pytest.fixture
-def mock_git_dry_run_with_files(mock_git_subprocess):
+def mock_git_dry_run_with_files(mock_run_git):
     """Mock git add --dry-run returning files."""
-    mock_result = MagicMock()
-    mock_result.stdout = "add 'file1.py'\nadd 'file2.py'\n"
-    mock_result.returncode = 0
-    mock_git_subprocess.return_value = mock_result
+    mock_run_git.return_value = "add 'file1.py'\nadd 'file2.py'\n"
 
 
 @pytest.fixture
@@ -144,9 +144,9 @@ def temp_config_file(tmp_path):
     return _create_config
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
 def clear_config_cache():
-    """Clear config cache before/after tests."""
+    """Clear config cache before/after every test."""
     from config import clear_config_cache
 
     clear_config_cache()
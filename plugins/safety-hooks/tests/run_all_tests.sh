@@ -43,6 +43,7 @@ TEST_FILES=(
     "$SCRIPT_DIR/test_env_protection.sh"
     "$SCRIPT_DIR/test_file_length.sh"
     "$SCRIPT_DIR/test_rm_block.sh"
+    "$SCRIPT_DIR/test_hook_daemon.sh"
 )
 
 PASSED_TESTS=()
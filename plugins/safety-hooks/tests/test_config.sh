@@ -46,6 +46,25 @@ print(f'has_py:{'.py' in DEFAULT_SOURCE_CODE_EXTENSIONS}')
     assert_contains "$output" "has_py:True" "Extensions list includes .py"
 }
 
+test_config_from_env_var() {
+    test_header "Config: SAFETY_HOOKS_CONFIG_JSON overrides config files"
+
+    local output
+    output=$(SAFETY_HOOKS_CONFIG_JSON='{"file_max_lines": 42, "file_extensions": [".py"], "unknown": 1}' python3 -c "
+import sys
+sys.path.insert(0, '$HOOKS_DIR')
+from config import get_config, get_source_code_extensions
+c = get_config()
+print('max_lines:' + str(c.file_max_lines))
+print('rm:' + str(c.rm_block_enabled))
+print('exts:' + ','.join(sorted(get_source_code_extensions())))
+" 2>&1)
+
+    assert_contains "$output" "max_lines:42" "Max lines taken from env var"
+    assert_contains "$output" "rm:True" "Unset fields keep defaults"
+    assert_contains "$output" "exts:.py" "Extensions taken from env var"
+}
+
 run_config_tests() {
     check_dependencies || exit 1
 
@@ -53,6 +72,7 @@ run_config_tests() {
     test_config_module_imports
     test_config_default_values
     test_config_extensions_list
+    test_config_from_env_var
 
     print_summary
 }
@@ -79,6 +79,37 @@ test_editor_env_blocked() {
     assert_json_value "$output" "decision" "block" "Opening .env in editor should be blocked"
 }
 
+test_ignored_env_file_allowed() {
+    test_header "Env Protection: Ignored .env files allowed"
+
+    # Create temp project with an ignore pattern (plus an invalid one to skip)
+    local tmp_dir
+    tmp_dir=$(mktemp -d)
+    mkdir -p "$tmp_dir/.claude/plugins"
+    cat > "$tmp_dir/.claude/plugins/safety-hooks-config.yaml" <<'YAML_EOF'
+env_protection:
+  ignore_patterns:
+    - '[invalid'
+    - '\.env\.example$'
+YAML_EOF
+    cd "$tmp_dir" || return 1
+
+    local input
+    local output
+    input=$(make_hook_input "Bash" "cat .env.example")
+    output=$(echo "$input" | python3 "$HOOK_SCRIPT" 2>&1)
+
+    assert_json_value "$output" "decision" "approve" "Ignored .env file should be approved"
+
+    input=$(make_hook_input "Bash" "cat .env")
+    output=$(echo "$input" | python3 "$HOOK_SCRIPT" 2>&1)
+
+    assert_json_value "$output" "decision" "block" "Non-ignored .env file should still be blocked"
+
+    cd - > /dev/null
+    rm -rf "$tmp_dir"
+}
+
 run_env_protection_tests() {
     check_dependencies || exit 1
 
@@ -89,6 +120,7 @@ run_env_protection_tests() {
     test_grep_env_blocked
     test_normal_command_allowed
     test_editor_env_blocked
+    test_ignored_env_file_allowed
 
     print_summary
 }
@@ -172,6 +172,121 @@ print(json.dumps(data))
     ((TESTS_RUN++))
 }
 
+test_edit_crossing_limit_should_ask() {
+    test_header "File Length: Edit pushing file over limit should ask"
+
+    # Existing file just under the limit; the edit adds two lines per occurrence
+    local tmp_dir
+    tmp_dir=$(mktemp -d)
+    python3 -c "print('line\\n' * 9997, end='')" > "$tmp_dir/edited.py"
+
+    local tmp_input
+    tmp_input=$(mktemp)
+    python3 -c "
+import json
+data = {
+    'session_id': 'test-session-123',
+    'transcript_path': '/tmp/transcript.txt',
+    'cwd': '/test/project',
+    'permission_mode': 'ask',
+    'hook_event_name': 'PreToolUse',
+    'tool_name': 'Edit',
+    'tool_input': {
+        'file_path': '$tmp_dir/edited.py',
+        'old_string': 'line\\n',
+        'new_string': 'line\\nextra\\nextra\\n',
+        'replace_all': False
+    }
+}
+print(json.dumps(data))
+" > "$tmp_input"
+
+    local output
+    local decision
+    output=$(cat "$tmp_input" | python3 "$HOOK_SCRIPT" 2>&1)
+    decision=$(_get_decision "$output")
+
+    ((TESTS_RUN++))
+    if [ "$decision" = "ask" ]; then
+        echo -e "${RED}✗${NC} Single edit to 9999 lines should not ask"
+        ((TESTS_FAILED++))
+    else
+        echo -e "${GREEN}✓${NC} Single edit staying under limit deferred"
+        ((TESTS_PASSED++))
+    fi
+
+    # Same edit with replace_all adds two lines for every occurrence
+    sed -i.bak 's/"replace_all": false/"replace_all": true/' "$tmp_input"
+    output=$(cat "$tmp_input" | python3 "$HOOK_SCRIPT" 2>&1)
+    decision=$(_get_decision "$output")
+
+    ((TESTS_RUN++))
+    if [ "$decision" = "ask" ]; then
+        echo -e "${GREEN}✓${NC} replace_all edit over limit should ask"
+        ((TESTS_PASSED++))
+    else
+        echo -e "${RED}✗${NC} replace_all edit over limit should ask (got: $decision)"
+        ((TESTS_FAILED++))
+    fi
+
+    rm -rf "$tmp_dir" "$tmp_input" "$tmp_input.bak"
+}
+
+test_edit_final_newline_at_boundary() {
+    test_header "File Length: Edit adding the final newline at the limit"
+
+    # 10000 lines, the last one without a trailing newline; terminating it
+    # keeps the file at 10000 lines
+    local tmp_dir
+    tmp_dir=$(mktemp -d)
+    python3 -c "print('x\\n' * 9999 + 'y', end='')" > "$tmp_dir/boundary.py"
+
+    local output
+    output=$(python3 -c "
+import json
+print(json.dumps({
+    'tool_name': 'Edit',
+    'tool_input': {'file_path': '$tmp_dir/boundary.py', 'old_string': 'y', 'new_string': 'y\\n'}
+}))
+" | python3 "$HOOK_SCRIPT" 2>&1)
+
+    local decision
+    decision=$(_get_decision "$output")
+
+    ((TESTS_RUN++))
+    if [ "$decision" = "ask" ]; then
+        echo -e "${RED}✗${NC} Terminating the last line should stay at 10000 lines"
+        ((TESTS_FAILED++))
+    else
+        echo -e "${GREEN}✓${NC} Terminating the last line stays at the limit"
+        ((TESTS_PASSED++))
+    fi
+
+    rm -rf "$tmp_dir"
+}
+
+test_edit_huge_file_reports_lower_bound() {
+    test_header "File Length: Edit to a huge file reports a lower bound"
+
+    # Far larger than one read, so the hook stops counting early
+    local tmp_dir
+    tmp_dir=$(mktemp -d)
+    python3 -c "print('line\\n' * 50000, end='')" > "$tmp_dir/huge.py"
+
+    local output
+    output=$(python3 -c "
+import json
+print(json.dumps({
+    'tool_name': 'Edit',
+    'tool_input': {'file_path': '$tmp_dir/huge.py', 'old_string': 'line\\n', 'new_string': 'other\\n'}
+}))
+" | python3 "$HOOK_SCRIPT" 2>&1)
+
+    assert_contains "$output" "more than 10000 lines" "Early exit should not report an exact line count"
+
+    rm -rf "$tmp_dir"
+}
+
 test_common_source_extensions() {
     test_header "File Length: Common source extensions are checked"
 
@@ -198,6 +313,9 @@ run_file_length_tests() {
     test_large_file_should_ask
     test_non_source_file_deferred
     test_exact_boundary_case
+    test_edit_crossing_limit_should_ask
+    test_edit_final_newline_at_boundary
+    test_edit_huge_file_reports_lower_bound
     test_common_source_extensions
 
     print_summary
@@ -93,6 +93,26 @@ test_git_add_with_dry_run_allowed() {
     assert_json_value "$output" "decision" "approve" "--dry-run should be allowed"
 }
 
+test_git_commit_all_message_sources() {
+    test_header "Git Add: 'git commit -a' allowed only with a message source"
+
+    local input
+    local output
+    input=$(make_hook_input "Bash" "git commit -a")
+    output=$(echo "$input" | python3 "$HOOK_SCRIPT" 2>&1)
+
+    assert_json_value "$output" "decision" "block" "'git commit -a' without a message should be blocked"
+
+    local command
+    for command in "git commit -a --amend --no-edit" "git commit --amend -a" \
+        "git commit -a --reuse-message=HEAD" "git commit -a -C HEAD" "git commit -aF msg.txt"; do
+        input=$(make_hook_input "Bash" "$command")
+        output=$(echo "$input" | python3 "$HOOK_SCRIPT" 2>&1)
+
+        assert_json_value "$output" "decision" "approve" "'$command' should not be blocked"
+    done
+}
+
 run_git_add_tests() {
     check_dependencies || exit 1
 
@@ -103,6 +123,7 @@ run_git_add_tests() {
     test_git_add_specific_file_allowed
     test_git_add_non_git_command_ignored
     test_git_add_with_dry_run_allowed
+    test_git_commit_all_message_sources
 
     print_summary
 }
@@ -20,6 +20,19 @@ test_git_checkout_force_blocked() {
     assert_contains "$output" "DANGEROUS" "Output should contain danger warning"
 }
 
+test_git_checkout_force_after_pipe_blocked() {
+    test_header "Git Checkout: Force flag after a pipe blocked"
+
+    local input
+    input=$(make_hook_input "Bash" "git checkout main | git checkout -f")
+
+    local output
+    output=$(echo "$input" | python3 "$HOOK_SCRIPT" 2>&1)
+
+    assert_json_value "$output" "decision" "block" "'git checkout -f' after '|' should be blocked"
+    assert_contains "$output" "DANGEROUS" "Output should contain danger warning"
+}
+
 test_git_checkout_dot_blocked() {
     test_header "Git Checkout: 'git checkout .' blocked with changes"
 
@@ -87,6 +100,7 @@ run_git_checkout_tests() {
 
     reset_counters
     test_git_checkout_force_blocked
+    test_git_checkout_force_after_pipe_blocked
     test_git_checkout_dot_blocked
     test_git_checkout_new_branch_allowed
     test_git_checkout_help_allowed
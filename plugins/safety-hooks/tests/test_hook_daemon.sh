@@ -0,0 +1,117 @@
+#!/bin/bash
+# Test hook_daemon and forwarding from the hook entry points
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+# shellcheck source=./test_helpers.sh
+source "$SCRIPT_DIR/test_helpers.sh"
+
+DAEMON_SCRIPT="$HOOKS_DIR/hook_daemon.py"
+BASH_HOOK_SCRIPT="$HOOKS_DIR/bash_hook.py"
+FILE_LENGTH_HOOK_SCRIPT="$HOOKS_DIR/file_length_limit_hook.py"
+
+DAEMON_PID=""
+SOCKET_PATH=""
+
+# Config for the daemon only, so its answers differ from a local check and a
+# test can tell that the payload was really forwarded
+DAEMON_CONFIG_JSON='{"rm_block_enabled": false, "file_max_lines": 1}'
+
+# Start the daemon in the background and wait for its socket to appear
+_start_daemon() {
+    SOCKET_PATH="$1/hooks.sock"
+    SAFETY_HOOKS_CONFIG_JSON="$DAEMON_CONFIG_JSON" python3 "$DAEMON_SCRIPT" "$SOCKET_PATH" &
+    DAEMON_PID=$!
+    for _ in $(seq 50); do
+        [ -S "$SOCKET_PATH" ] && return 0
+        sleep 0.1
+    done
+    return 1
+}
+
+_stop_daemon() {
+    kill "$DAEMON_PID" 2> /dev/null
+    wait "$DAEMON_PID" 2> /dev/null
+}
+
+test_daemon_answers_requests() {
+    test_header "Hook Daemon: Daemon answers forwarded requests"
+
+    local output
+    output=$(SAFETY_HOOK_SOCK="$SOCKET_PATH" python3 -c "
+from hook_io import forward_to_daemon
+print(forward_to_daemon('bash', {'tool_name': 'Bash', 'tool_input': {'command': 'ls'}}))
+")
+
+    assert_contains "$output" "'decision': 'approve'" "Daemon should return the bash hook result"
+}
+
+test_bash_hook_via_daemon() {
+    test_header "Hook Daemon: bash_hook forwards to the daemon"
+
+    local input
+    input=$(make_hook_input "Bash" "rm file.txt")
+
+    local output
+    output=$(echo "$input" | SAFETY_HOOK_SOCK="$SOCKET_PATH" python3 "$BASH_HOOK_SCRIPT" 2>&1)
+
+    assert_json_value "$output" "decision" "approve" "'rm' should be approved under the daemon's config"
+}
+
+test_file_length_hook_via_daemon() {
+    test_header "Hook Daemon: file_length_limit_hook forwards to the daemon"
+
+    local input
+    input=$(python3 -c "
+import json
+print(json.dumps({'tool_name': 'Write', 'tool_input': {'file_path': 'test.py', 'content': 'x = 1\\ny = 2\\n'}}))
+")
+
+    local output
+    output=$(echo "$input" | SAFETY_HOOK_SOCK="$SOCKET_PATH" python3 "$FILE_LENGTH_HOOK_SCRIPT" 2>&1)
+
+    assert_contains "$output" "File length limit exceeded" "Two-line file should exceed the daemon's one-line limit"
+}
+
+test_fallback_without_daemon() {
+    test_header "Hook Daemon: Hooks check locally when the daemon is unreachable"
+
+    local input
+    input=$(make_hook_input "Bash" "rm file.txt")
+
+    local output
+    output=$(echo "$input" | SAFETY_HOOK_SOCK="$1/missing.sock" python3 "$BASH_HOOK_SCRIPT" 2>&1)
+
+    assert_json_value "$output" "permissionDecision" "deny" "'rm' should be denied by the local check"
+}
+
+run_hook_daemon_tests() {
+    check_dependencies || exit 1
+
+    reset_counters
+
+    # Run outside any git repo so blocked rm commands don't touch a .gitignore
+    local scratch_dir
+    scratch_dir=$(mktemp -d)
+    pushd "$scratch_dir" > /dev/null || exit 1
+
+    if _start_daemon "$scratch_dir"; then
+        test_daemon_answers_requests
+        test_bash_hook_via_daemon
+        test_file_length_hook_via_daemon
+    else
+        ((TESTS_RUN++))
+        ((TESTS_FAILED++))
+        echo -e "${RED}✗${NC} Daemon did not start"
+    fi
+    _stop_daemon
+    test_fallback_without_daemon "$scratch_dir"
+
+    popd > /dev/null || exit 1
+    rm -rf "$scratch_dir"
+
+    print_summary
+}
+
+if [ "${BASH_SOURCE[0]}" = "$0" ]; then
+    run_hook_daemon_tests
+fi
@@ -44,6 +44,22 @@ test_rm_with_path_blocked() {
     assert_json_value "$output" "decision" "block" "'/bin/rm' should be blocked"
 }
 
+test_rm_in_compound_command_blocked() {
+    test_header "RM Block: 'rm' after a command separator blocked"
+
+    local input
+    local output
+    input=$(make_hook_input "Bash" "cd build && rm -rf out")
+    output=$(echo "$input" | python3 "$HOOK_SCRIPT" 2>&1)
+
+    assert_json_value "$output" "decision" "block" "'rm' after '&&' should be blocked"
+
+    input=$(make_hook_input "Bash" "ls;rmdir empty")
+    output=$(echo "$input" | python3 "$HOOK_SCRIPT" 2>&1)
+
+    assert_json_value "$output" "decision" "approve" "'rmdir' should not be treated as 'rm'"
+}
+
 test_non_rm_command_allowed() {
     test_header "RM Block: Non-rm commands allowed"
 
@@ -80,6 +96,21 @@ test_grep_rm_not_blocked() {
     assert_json_value "$output" "decision" "approve" "'grep' should not be blocked"
 }
 
+test_large_heredoc_allowed() {
+    test_header "RM Block: Large heredoc with many separators checked quickly"
+
+    # ~500 KB markdown table: tens of thousands of '|' and an 'rm' substring
+    local output
+    output=$(python3 -c "
+import json
+row = '| format | value | other column | x |\n'
+command = \"cat <<'EOF' > table.md\n\" + row * 13000 + 'EOF'
+print(json.dumps({'tool_name': 'Bash', 'tool_input': {'command': command}}))
+" | timeout 2 python3 "$HOOK_SCRIPT" 2>&1)
+
+    assert_json_value "$output" "decision" "approve" "Large heredoc should be approved well within the hook timeout"
+}
+
 test_gitignore_entries_added() {
     test_header "RM Block: .gitignore entries added in git repo"
 
@@ -143,6 +174,47 @@ PYTHON_EOF
     rm -rf "$tmp_dir"
 }
 
+test_gitignore_existing_file_appended() {
+    test_header "RM Block: entries appended to existing .gitignore"
+
+    # Create temp git repo with a .gitignore lacking a trailing newline
+    local tmp_dir
+    tmp_dir=$(mktemp -d)
+    cd "$tmp_dir" || return 1
+    git init -q
+    printf 'node_modules' > .gitignore
+
+    local input
+    input=$(python3 <<PYTHON_EOF
+import json
+print(json.dumps({
+    'session_id': 'test-session-123',
+    'transcript_path': '/tmp/transcript.txt',
+    'cwd': '$tmp_dir',
+    'permission_mode': 'ask',
+    'hook_event_name': 'PreToolUse',
+    'tool_name': 'Bash',
+    'tool_input': {'command': 'rm file.txt'}
+}))
+PYTHON_EOF
+)
+
+    local output
+    output=$(echo "$input" | python3 "$HOOK_SCRIPT" 2>&1)
+
+    ((TESTS_RUN++))
+    if grep -qx "node_modules" .gitignore && grep -qx "TRASH/" .gitignore; then
+        echo -e "${GREEN}✓${NC} TRASH/ appended on its own line"
+        ((TESTS_PASSED++))
+    else
+        echo -e "${RED}✗${NC} Existing .gitignore not extended correctly"
+        ((TESTS_FAILED++))
+    fi
+
+    cd - > /dev/null
+    rm -rf "$tmp_dir"
+}
+
 test_gitignore_no_duplicates() {
     test_header "RM Block: .gitignore entries not duplicated"
 
@@ -288,13 +360,25 @@ run_rm_block_tests() {
     check_dependencies || exit 1
 
     reset_counters
+
+    # Run the basic checks outside any git repo so blocked rm commands
+    # don't append TRASH entries to this repo's .gitignore
+    local scratch_dir
+    scratch_dir=$(mktemp -d)
+    pushd "$scratch_dir" > /dev/null || exit 1
     test_rm_command_blocked
     test_rm_recursive_blocked
     test_rm_with_path_blocked
+    test_rm_in_compound_command_blocked
     test_non_rm_command_allowed
     test_trash_command_allowed
     test_grep_rm_not_blocked
+    test_large_heredoc_allowed
+    popd > /dev/null || exit 1
+    rm -rf "$scratch_dir"
+
     test_gitignore_entries_added
+    test_gitignore_existing_file_appended
     test_gitignore_no_duplicates
     test_gitignore_from_subdirectory
     test_gitignore_not_added_outside_git
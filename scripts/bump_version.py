@@ -5,19 +5,33 @@ Updates both the marketplace.json manifest and the plugin's own plugin.json.
 """
 
 import argparse
-import json
-import re
-from dataclasses import dataclass
+import os
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None
+
 
-@dataclass
 class Version:
     """Semantic version."""
 
-    major: int
-    minor: int
-    patch: int
+    __slots__ = ("major", "minor", "patch")
+
+    def __init__(self, major: int, minor: int, patch: int) -> None:
+        self.major = major
+        self.minor = minor
+        self.patch = patch
+
+    def __repr__(self) -> str:
+        return f"Version(major={self.major}, minor={self.minor}, patch={self.patch})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return (self.major, self.minor, self.patch) == (other.major, other.minor, other.patch)
 
     def __str__(self) -> str:
         return f"{self.major}.{self.minor}.{self.patch}"
@@ -25,10 +39,11 @@ class Version:
     @classmethod
     def parse(cls, version: str) -> "Version":
         """Parse a version string."""
-        match = re.match(r"(\d+)\.(\d+)\.(\d+)", version)
-        if not match:
+        # Exactly three dot-separated runs of digits; no regex needed
+        parts = version.split(".")
+        if len(parts) != 3 or not all(part.isdecimal() for part in parts):
             raise ValueError(f"Invalid version format: {version}")
-        return cls(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        return cls(int(parts[0]), int(parts[1]), int(parts[2]))
 
     def bump(self, part: str) -> "Version":
         """Bump a version part."""
@@ -41,27 +56,93 @@ class Version:
         raise ValueError(f"Invalid version part: {part}")
 
 
+@lru_cache(maxsize=1)
+def _plugin_dirs(repo_root: Path) -> frozenset[str]:
+    """Names of the plugin directories under repo_root/plugins, listed once."""
+    try:
+        return frozenset(entry.name for entry in os.scandir(repo_root / "plugins") if entry.is_dir())
+    except FileNotFoundError:
+        return frozenset()
+
+
 def find_plugin_dir(plugin_name: str, repo_root: Path) -> Path:
     """Find the plugin directory."""
     plugin_dir = repo_root / "plugins" / plugin_name
-    if not plugin_dir.exists():
-        raise ValueError(f"Plugin directory not found: {plugin_dir}")
+    if plugin_name not in _plugin_dirs(repo_root):
+        import difflib
+
+        message = f"Plugin directory not found: {plugin_dir}"
+        suggestions = difflib.get_close_matches(plugin_name, sorted(_plugin_dirs(repo_root)))
+        if suggestions:
+            message += f" (did you mean: {', '.join(suggestions)}?)"
+        raise ValueError(message)
     return plugin_dir
 
 
+@lru_cache(maxsize=16)
+def _load_json_cached(path: str, mtime_ns: int) -> dict:
+    """Parse a JSON file, memoized on its path and modification time."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    import json
+
+    return json.loads(raw)
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return the file's modification time, with a clear error if it is missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
+
+
 def load_json(path: Path) -> dict:
-    """Load and parse a JSON file."""
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
-    with path.open() as f:
-        return json.load(f)
+    """Load and parse a JSON file.
+
+    Loads of an unchanged file share one parsed dict; save_json clears the
+    cache so the next load re-reads what was written.
+    """
+    return _load_json_cached(str(path), _mtime_ns(path))
+
+
+def plugins_by_name(marketplace: dict) -> dict[str, dict]:
+    """Map plugin names to their entries in a loaded marketplace.json dict."""
+    index: dict[str, dict] = {}
+    for plugin in marketplace.get("plugins", []):
+        # First entry wins, as with a linear scan
+        index.setdefault(plugin.get("name"), plugin)
+    return index
 
 
 def save_json(path: Path, data: dict) -> None:
-    """Save data to a JSON file with pretty formatting."""
-    with path.open("w") as f:
-        json.dump(data, f, indent=2, sort_keys=False)
-        f.write("\n")
+    """Save data to a JSON file with pretty formatting (2-space indent, trailing newline).
+
+    The file is written to a temporary sibling, fsynced and renamed over the
+    original, so a crash never leaves a half-written manifest.
+    """
+    # Callers have already mutated the cached dict, so drop it whatever happens next
+    _load_json_cached.cache_clear()
+
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        import json
+
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def get_current_version(plugin_dir: Path, plugin_name: str) -> Version:
@@ -74,29 +155,34 @@ def get_current_version(plugin_dir: Path, plugin_name: str) -> Version:
     return Version.parse(version_str)
 
 
-def update_plugin_manifest(plugin_dir: Path, new_version: Version) -> None:
-    """Update the plugin's plugin.json."""
+def update_plugin_manifest(plugin_dir: Path, new_version: Version, cwd: Path) -> None:
+    """Update the plugin's plugin.json (paths are reported relative to cwd)."""
     plugin_json = plugin_dir / ".claude-plugin" / "plugin.json"
     data = load_json(plugin_json)
+    if data.get("version") == str(new_version):
+        print(f"{plugin_json.relative_to(cwd)} already at {new_version}")
+        return
     data["version"] = str(new_version)
     save_json(plugin_json, data)
-    print(f"Updated {plugin_json.relative_to(Path.cwd())} -> {new_version}")
+    print(f"Updated {plugin_json.relative_to(cwd)} -> {new_version}")
 
 
-def update_marketplace_manifest(repo_root: Path, plugin_name: str, new_version: Version) -> None:
-    """Update the marketplace.json."""
+def update_marketplace_manifest(repo_root: Path, plugin_name: str, new_version: Version, cwd: Path) -> None:
+    """Update the marketplace.json (paths are reported relative to cwd)."""
     marketplace_json = repo_root / ".claude-plugin" / "marketplace.json"
     data = load_json(marketplace_json)
 
-    # Find the plugin in the plugins array
-    for plugin in data.get("plugins", []):
-        if plugin.get("name") == plugin_name:
-            plugin["version"] = str(new_version)
-            save_json(marketplace_json, data)
-            print(f"Updated {marketplace_json.relative_to(Path.cwd())} -> {new_version}")
-            return
+    # Look up the plugin's entry in the plugins array (mutating it updates data)
+    plugin = plugins_by_name(data).get(plugin_name)
+    if plugin is None:
+        raise ValueError(f"Plugin '{plugin_name}' not found in marketplace.json")
 
-    raise ValueError(f"Plugin '{plugin_name}' not found in marketplace.json")
+    if plugin.get("version") == str(new_version):
+        print(f"{marketplace_json.relative_to(cwd)} already at {new_version}")
+        return
+    plugin["version"] = str(new_version)
+    save_json(marketplace_json, data)
+    print(f"Updated {marketplace_json.relative_to(cwd)} -> {new_version}")
 
 
 def list_plugins(repo_root: Path) -> None:
@@ -160,8 +246,9 @@ def main() -> None:
         print("(dry run, no changes made)")
         return
 
-    update_plugin_manifest(plugin_dir, new_version)
-    update_marketplace_manifest(repo_root, args.plugin, new_version)
+    cwd = Path.cwd()
+    update_plugin_manifest(plugin_dir, new_version, cwd)
+    update_marketplace_manifest(repo_root, args.plugin, new_version, cwd)
     print("Version bump complete!")
 
 